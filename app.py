@@ -1,30 +1,118 @@
 """Gradio MCP server for Common Core Standards search and lookup."""
 
+import functools
 import os
-import json
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
+import orjson
+import requests
 from dotenv import load_dotenv
 import gradio as gr
-from huggingface_hub import InferenceClient
+from huggingface_hub import InferenceClient, configure_http_backend
 from loguru import logger
 
 # Load environment variables from .env file
 load_dotenv()
 
-from src.search import find_relevant_standards_impl
-from src.lookup import get_standard_details_impl
+from src.search import find_relevant_standards_dict
+from src.lookup import (
+    get_standard_details_batch,
+    get_standard_details_dict,
+    get_standard_details_impl,
+)
+
+# Shared pool for running independent I/O-bound tool calls concurrently
+_tool_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="tool-call")
+
+
+def _run_find_relevant_standards(function_args: dict) -> dict:
+    """Adapter mapping model-provided arguments onto the search impl."""
+    return find_relevant_standards_dict(
+        activity=function_args.get("activity", ""),
+        max_results=function_args.get("max_results", 5),
+        grade=function_args.get("grade"),
+    )
+
+
+def _run_get_standard_details(function_args: dict) -> dict:
+    """Adapter mapping model-provided arguments onto the standard lookup."""
+    return get_standard_details_dict(
+        standard_id=function_args.get("standard_id", "")
+    )
+
+
+# Tool-name -> adapter table. Adding a tool is one entry here plus its
+# schema in TOOLS; dispatch is a single dict lookup.
+_TOOL_DISPATCH: dict[str, Callable[[dict], dict]] = {
+    "find_relevant_standards": _run_find_relevant_standards,
+    "get_standard_details": _run_get_standard_details,
+}
+
+
+def _dispatch_tool_call(function_name: str, function_args: dict) -> dict:
+    """
+    Execute a single tool call and return its structured result.
+
+    Returning a dict lets the caller serialize exactly once at the boundary
+    instead of round-tripping serialize -> parse -> serialize per tool call.
+
+    Args:
+        function_name: Name of the tool requested by the model.
+        function_args: Parsed arguments from the tool call.
+
+    Returns:
+        Result dict from the tool, or an error dict for unknown tools.
+    """
+    impl = _TOOL_DISPATCH.get(function_name)
+    if impl is None:
+        return {"error": f"Function {function_name} not available"}
+    return impl(function_args)
+
+
+def _http_session_factory() -> requests.Session:
+    """
+    Build the shared HTTP session used by huggingface_hub.
+
+    An explicit pooled adapter keeps connections to the inference provider
+    alive across chat turns, so the TCP+TLS handshake is paid once instead
+    of per request.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=10, pool_maxsize=10)
+    session.mount("https://", adapter)
+    return session
+
 
-# Initialize the Hugging Face Inference Client
 # Use HF_TOKEN from environment (automatically available in Hugging Face Spaces)
-# Provider is required for models that need Inference Providers (e.g., Together AI, Nebius)
 HF_TOKEN = os.environ.get("HF_TOKEN")
-client = InferenceClient(
-    provider="together",  # Required: specifies the inference provider for tool calling
-    token=HF_TOKEN
-)
 
-# Define the function schemas in OpenAI format for the model
-TOOLS = [
+
+@functools.lru_cache(maxsize=1)
+def _get_inference_client() -> InferenceClient:
+    """
+    Lazily build the shared Hugging Face Inference Client.
+
+    Deferring construction to first use keeps client setup off the module
+    import path, so importing app.py for its tool impls (tests, tooling)
+    doesn't pay for it. The instance is cached for all chat turns.
+    """
+    configure_http_backend(backend_factory=_http_session_factory)
+    return InferenceClient(
+        provider="together",  # Required: specifies the inference provider for tool calling
+        token=HF_TOKEN,
+    )
+
+# Valid grade level codes, in display order. The frozenset gives O(1)
+# membership checks for pre-dispatch validation.
+_GRADE_LEVELS = ("K", "01", "02", "03", "04", "05", "06", "07", "08", "09", "10", "11", "12", "09-12")
+_VALID_GRADES = frozenset(_GRADE_LEVELS)
+
+# Define the function schemas in OpenAI format for the model. Frozen as a
+# tuple so the schema can't be mutated between calls; the inner dicts stay
+# plain because the SDK JSON-serializes them per request (a MappingProxyType
+# wrapper would break that).
+TOOLS = (
     {
         "type": "function",
         "function": {
@@ -47,7 +135,7 @@ TOOLS = [
                     "grade": {
                         "type": "string",
                         "description": "Optional grade level filter. Valid values: K, 01, 02, 03, 04, 05, 06, 07, 08, 09, 10, 11, 12, or 09-12 for high school range.",
-                        "enum": ["K", "01", "02", "03", "04", "05", "06", "07", "08", "09", "10", "11", "12", "09-12"]
+                        "enum": list(_GRADE_LEVELS)
                     }
                 },
                 "required": ["activity"]
@@ -71,7 +159,42 @@ TOOLS = [
             }
         }
     }
-]
+)
+
+# System message reused across all chat turns. The API call never mutates it,
+# so one shared dict avoids a rebuild per invocation.
+_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a helpful assistant for parents and teachers. Your role is to help them plan educational activities and find educational requirements for activities they might have already done. You have access to tools that can search for standards and retrieve standard details. Use these tools when users ask about standards, learning activities, or educational requirements. Always provide clear, helpful responses based on the tool results.",
+}
+
+# Maximum number of past history messages sent to the model per turn. Without
+# a bound, long sessions re-send the whole transcript every turn, paying
+# quadratic cumulative token cost.
+_HISTORY_WINDOW = 20
+
+# Frozen markdown template for collapsible tool-call blocks. Formatting a
+# cached template avoids rebuilding the literal per tool call in the chat loop.
+_TOOL_MD_TEMPLATE = """<details>
+<summary><strong>🔧 Tool Call: {function}</strong></summary>
+
+**Arguments:**
+```json
+{args}
+```
+
+**Result:**
+```json
+{res}
+```
+</details>
+"""
+
+# Pre-serialized TOOLS payload, frozen at import. The SDK serializes the
+# request body itself, but callers that build raw requests (or future SDK
+# bypasses) can reuse these bytes instead of re-encoding the schema per turn.
+TOOLS_JSON = orjson.dumps(TOOLS)
+
 
 def find_relevant_standards(
     activity: str,
@@ -143,10 +266,25 @@ def find_relevant_standards(
     if grade == "":
         grade = None
 
+    # Reject invalid grades locally before paying for a Pinecone round-trip
+    if grade and grade not in _VALID_GRADES:
+        return orjson.dumps(
+            {
+                "success": False,
+                "results": [],
+                "message": f"Invalid grade '{grade}'. Valid values: {', '.join(_GRADE_LEVELS)}",
+                "error_type": "invalid_input",
+            }
+        ).decode()
+
     # Ensure max_results is an integer (gr.Number returns float by default)
     max_results = int(max_results)
 
-    return find_relevant_standards_impl(activity, max_results, grade)
+    # Compact JSON: the response goes over the MCP transport, where
+    # indentation only inflates the payload
+    return orjson.dumps(
+        find_relevant_standards_dict(activity, max_results, grade)
+    ).decode()
 
 
 def get_standard_details(standard_id: str) -> str:
@@ -200,6 +338,39 @@ def get_standard_details(standard_id: str) -> str:
     return get_standard_details_impl(standard_id)
 
 
+def _convert_history(history: list) -> list[dict]:
+    """
+    Convert Gradio 6 structured history to OpenAI messages format.
+
+    Gradio 6 uses structured content: {"role": "user", "content":
+    [{"type": "text", "text": "..."}]}. Text blocks are flattened with a
+    single generator pass per message instead of nested accumulator loops,
+    which keeps re-processing long histories cheap on every chat turn.
+
+    Args:
+        history: Chat history in Gradio 6 messages format (may be None/empty)
+
+    Returns:
+        List of {"role", "content"} message dicts with flattened text content
+    """
+    messages = []
+    for msg in history or []:
+        if not isinstance(msg, dict):
+            continue
+
+        content = msg.get("content", "")
+        if isinstance(content, list):
+            content = " ".join(
+                block.get("text", "")
+                for block in content
+                if isinstance(block, dict) and block.get("type") == "text"
+            )
+
+        messages.append({"role": msg.get("role", "user"), "content": content})
+
+    return messages
+
+
 def chat_with_standards(message: str, history: list):
     """
     Chat function that uses MCP tools via Hugging Face Inference API with tool calling.
@@ -214,48 +385,26 @@ def chat_with_standards(message: str, history: list):
             "role" and "content" keys. In Gradio 6, content uses structured format:
             [{"type": "text", "text": "..."}, ...] for text content.
 
-    Returns:
+    Yields:
         Structured content as a list of content blocks. When tool calls are made, includes:
         - Expandable JSON blocks showing tool call results
-        - The final assistant response as text
-        When no tool calls are made, returns a simple text response.
+        - The final assistant response, streamed incrementally as it is generated
+        When no tool calls are made, yields a simple text response.
     """
     # Convert Gradio 6 history format to OpenAI messages format
-    # Gradio 6 uses structured content: {"role": "user", "content": [{"type": "text", "text": "..."}]}
-    messages = []
-    if history:
-        for msg in history:
-            if isinstance(msg, dict):
-                role = msg.get("role", "user")
-                content = msg.get("content", "")
-
-                # Handle Gradio 6 structured content format
-                if isinstance(content, list):
-                    # Extract text from content blocks
-                    text_parts = []
-                    for block in content:
-                        if isinstance(block, dict) and block.get("type") == "text":
-                            text_parts.append(block.get("text", ""))
-                    content = " ".join(text_parts)
-
-                messages.append({
-                    "role": role,
-                    "content": content
-                })
-
-    # Add system message to guide the model
-    system_message = {
-        "role": "system",
-        "content": "You are a helpful assistant for parents and teachers. Your role is to help them plan educational activities and find educational requirements for activities they might have already done. You have access to tools that can search for standards and retrieve standard details. Use these tools when users ask about standards, learning activities, or educational requirements. Always provide clear, helpful responses based on the tool results."
-    }
-
-    # Add current user message
-    messages.append({"role": "user", "content": message})
+    messages = _convert_history(history)
 
-    # Prepare full message list with system message
-    full_messages = [system_message] + messages
+    # Prepare full message list: shared system message, a bounded window of
+    # recent history, and the current user message
+    full_messages = [
+        _SYSTEM_MESSAGE,
+        *messages[-_HISTORY_WINDOW:],
+        {"role": "user", "content": message},
+    ]
 
     try:
+        client = _get_inference_client()
+
         # Initial API call with tools
         response = client.chat.completions.create(
             model="Qwen/Qwen2.5-7B-Instruct",
@@ -276,30 +425,40 @@ def chat_with_standards(message: str, history: list):
             # Store tool call results for display
             tool_results = []
 
-            # Process each tool call
-            for tool_call in response_message.tool_calls:
-                function_name = tool_call.function.name
-                function_args = json.loads(tool_call.function.arguments)
-
-                # Execute the function
-                if function_name == "find_relevant_standards":
-                    result = find_relevant_standards_impl(
-                        activity=function_args.get("activity", ""),
-                        max_results=function_args.get("max_results", 5),
-                        grade=function_args.get("grade"),
-                    )
-                elif function_name == "get_standard_details":
-                    result = get_standard_details_impl(
-                        standard_id=function_args.get("standard_id", "")
-                    )
-                else:
-                    result = json.dumps({"error": f"Function {function_name} not available"})
+            # Parse all tool calls up front, then execute them concurrently.
+            # Each call is an independent I/O-bound Pinecone request, so the
+            # tool phase costs max() of the calls instead of their sum.
+            parsed_calls = [
+                (tool_call, tool_call.function.name, orjson.loads(tool_call.function.arguments))
+                for tool_call in response_message.tool_calls
+            ]
+            # Coalesce multiple get_standard_details calls into one Pinecone
+            # fetch; the fetch endpoint accepts many IDs per request
+            detail_ids = [
+                function_args.get("standard_id", "")
+                for _, function_name, function_args in parsed_calls
+                if function_name == "get_standard_details"
+            ]
+            batched_details = (
+                get_standard_details_batch(detail_ids) if len(detail_ids) > 1 else {}
+            )
 
-                # Parse result JSON for display
-                try:
-                    result_data = json.loads(result) if isinstance(result, str) else result
-                except json.JSONDecodeError:
-                    result_data = {"raw_result": result}
+            futures = [
+                None
+                if batched_details and function_name == "get_standard_details"
+                else _tool_executor.submit(_dispatch_tool_call, function_name, function_args)
+                for _, function_name, function_args in parsed_calls
+            ]
+
+            # Reassemble results in original tool_calls order to preserve
+            # tool_call_id correlation in the message history
+            for (tool_call, function_name, function_args), future in zip(
+                parsed_calls, futures
+            ):
+                if future is None:
+                    result_data = batched_details[function_args.get("standard_id", "")]
+                else:
+                    result_data = future.result()
 
                 # Store tool call info for display
                 tool_results.append({
@@ -308,46 +467,31 @@ def chat_with_standards(message: str, history: list):
                     "result": result_data
                 })
 
-                # Add function result to messages
+                # Add function result to messages, serialized once at the boundary
                 full_messages.append({
                     "role": "tool",
                     "tool_call_id": tool_call.id,
                     "name": function_name,
-                    "content": result,
+                    "content": orjson.dumps(result_data).decode(),
                 })
 
-            # Get final response with function results
-            final_response = client.chat.completions.create(
-                model="Qwen/Qwen2.5-7B-Instruct",
-                messages=full_messages,
-                temperature=0.7,
-                max_tokens=1000,
-            )
-
             # Build structured response with tool call results and final answer
             response_blocks = []
             
             # Add tool call results as expandable JSON blocks using markdown
             for i, tool_result in enumerate(tool_results):
                 # Format arguments and result as pretty JSON
-                args_json = json.dumps(tool_result["arguments"], indent=2)
-                result_json = json.dumps(tool_result["result"], indent=2)
+                args_json = orjson.dumps(
+                    tool_result["arguments"], option=orjson.OPT_INDENT_2
+                ).decode()
+                result_json = orjson.dumps(
+                    tool_result["result"], option=orjson.OPT_INDENT_2
+                ).decode()
                 
                 # Create collapsible markdown section
-                tool_markdown = f"""<details>
-<summary><strong>🔧 Tool Call: {tool_result["function"]}</strong></summary>
-
-**Arguments:**
-```json
-{args_json}
-```
-
-**Result:**
-```json
-{result_json}
-```
-</details>
-"""
+                tool_markdown = _TOOL_MD_TEMPLATE.format_map(
+                    {"function": tool_result["function"], "args": args_json, "res": result_json}
+                )
                 response_blocks.append({
                     "type": "text",
                     "text": tool_markdown
@@ -358,21 +502,33 @@ def chat_with_standards(message: str, history: list):
                 "type": "text",
                 "text": "---\n"
             })
-            
-            # Add final assistant response as text
-            response_blocks.append({
-                "type": "text",
-                "text": final_response.choices[0].message.content
-            })
 
-            return response_blocks
+            # Show tool results immediately while the final answer streams in
+            yield response_blocks
+
+            # Stream the final response with function results. Streaming
+            # overlaps token generation with rendering, so the first tokens
+            # appear as soon as the model produces them instead of after the
+            # full completion.
+            accumulated = ""
+            for chunk in client.chat.completions.create(
+                model="Qwen/Qwen2.5-7B-Instruct",
+                messages=full_messages,
+                temperature=0.7,
+                max_tokens=1000,
+                stream=True,
+            ):
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    accumulated += delta
+                    yield response_blocks + [{"type": "text", "text": accumulated}]
         else:
             # No tool calls, return direct response as text
-            return response_message.content
+            yield response_message.content
 
     except Exception as e:
         # Error handling
-        return f"I apologize, but I encountered an error: {str(e)}. Please try again or rephrase your question."
+        yield f"I apologize, but I encountered an error: {str(e)}. Please try again or rephrase your question."
 
 
 # Create Gradio interface
@@ -392,7 +548,7 @@ demo = gr.TabbedInterface(
                 gr.Number(label="Max Results", value=5, minimum=1, maximum=20),
                 gr.Dropdown(
                     label="Grade (optional)",
-                    choices=["", "K", "01", "02", "03", "04", "05", "06", "07", "08", "09", "10", "11", "12", "09-12"],
+                    choices=["", *_GRADE_LEVELS],
                     value=None,
                     info="Select a grade level to filter results"
                 ),
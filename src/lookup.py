@@ -2,80 +2,191 @@
 
 from __future__ import annotations
 
-import json
+import re
 
+import orjson
 from pinecone.exceptions import PineconeException
 
-from src.pinecone_client import PineconeClient
+from src.pinecone_client import get_pinecone_client
 
+# Standard GUIDs are 32 hex chars (e.g., "EA60C8D165F6481B90BFF782CE193F93").
+# Validating locally avoids a Pinecone round-trip for the common case where
+# the model passes a statement notation like "3.NF.A.1" instead of a GUID.
+_GUID_RE = re.compile(r"^[0-9A-Fa-f]{32}$")
 
-def get_standard_details_impl(standard_id: str) -> str:
+
+def _invalid_guid_response(standard_id: str) -> dict:
+    """Build the invalid-GUID error response for a malformed standard ID."""
+    return {
+        "success": False,
+        "results": [],
+        "message": f"'{standard_id}' is not a valid GUID. This function only accepts 32-character hex GUIDs (e.g., 'EA60C8D165F6481B90BFF782CE193F93'). For statement notations like '3.NF.A.1' or other identifiers, use find_relevant_standards with a keyword search instead.",
+        "error_type": "invalid_input",
+    }
+
+
+def get_standard_details_dict(standard_id: str) -> dict:
     """
-    Implementation of direct standard lookup by GUID only.
+    Implementation of direct standard lookup by GUID only, returning a dict.
 
     This function only accepts GUIDs (_id field) from Pinecone. It does NOT accept
     statement_notation or other identifier formats. Use find_relevant_standards to
     search for standards by content or metadata.
 
+    Callers that need the structured response (e.g., for display) should use this
+    directly to avoid a serialize/parse round-trip; get_standard_details_impl wraps
+    it for callers that need a JSON string.
+
     Args:
         standard_id: The standard's GUID (_id field) - must be a valid GUID format
             (e.g., "EA60C8D165F6481B90BFF782CE193F93")
 
     Returns:
-        JSON string with structured response containing standard details
+        Dict with structured response containing standard details
     """
     # Input validation
     if not standard_id or not standard_id.strip():
-        return json.dumps(
-            {
-                "success": False,
-                "results": [],
-                "message": "Standard ID cannot be empty",
-                "error_type": "invalid_input",
-            }
-        )
+        return {
+            "success": False,
+            "results": [],
+            "message": "Standard ID cannot be empty",
+            "error_type": "invalid_input",
+        }
+
+    # Short-circuit obviously malformed IDs without a network call
+    if not _GUID_RE.match(standard_id.strip()):
+        return _invalid_guid_response(standard_id)
 
     try:
-        # Initialize client and fetch standard
-        client = PineconeClient()
+        # Reuse the shared client to avoid per-call SDK initialization
+        client = get_pinecone_client()
         result = client.fetch_standard(standard_id.strip())
 
         # Handle not found
         if result is None:
-            return json.dumps(
-                {
-                    "success": False,
-                    "results": [],
-                    "message": f"Standard with GUID '{standard_id}' not found. This function only accepts GUIDs (e.g., 'EA60C8D165F6481B90BFF782CE193F93'). For statement notations or other identifiers, use find_relevant_standards with a keyword search instead.",
-                    "error_type": "not_found",
-                }
-            )
+            return {
+                "success": False,
+                "results": [],
+                "message": f"Standard with GUID '{standard_id}' not found. This function only accepts GUIDs (e.g., 'EA60C8D165F6481B90BFF782CE193F93'). For statement notations or other identifiers, use find_relevant_standards with a keyword search instead.",
+                "error_type": "not_found",
+            }
 
         # Format successful result
-        response = {
+        return {
             "success": True,
             "results": [result],
             "message": "Retrieved standard details",
         }
 
-        return json.dumps(response, indent=2)
+    except PineconeException as e:
+        return {
+            "success": False,
+            "results": [],
+            "message": f"Pinecone API error: {str(e)}",
+            "error_type": "api_error",
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "results": [],
+            "message": f"Unexpected error: {str(e)}",
+            "error_type": "api_error",
+        }
+
+
+def get_standard_details_batch(standard_ids: list[str]) -> dict[str, dict]:
+    """
+    Look up several standards with a single Pinecone fetch.
+
+    When the model issues N parallel get_standard_details tool calls, this
+    collapses the N fetch round-trips into one. Each input ID maps to the
+    same structured response dict get_standard_details_dict would produce.
+
+    Args:
+        standard_ids: Standard GUIDs (_id field) to look up
+
+    Returns:
+        Dict mapping each input ID to its structured response dict
+    """
+    responses: dict[str, dict] = {}
+
+    # Validate inputs locally; only well-formed GUIDs go to Pinecone
+    ids_to_fetch: list[str] = []
+    for standard_id in standard_ids:
+        if not standard_id or not standard_id.strip():
+            responses[standard_id] = {
+                "success": False,
+                "results": [],
+                "message": "Standard ID cannot be empty",
+                "error_type": "invalid_input",
+            }
+        elif not _GUID_RE.match(standard_id.strip()):
+            responses[standard_id] = _invalid_guid_response(standard_id)
+        else:
+            ids_to_fetch.append(standard_id)
+
+    if not ids_to_fetch:
+        return responses
 
+    try:
+        client = get_pinecone_client()
+        fetched = client.fetch_standards([sid.strip() for sid in ids_to_fetch])
     except PineconeException as e:
-        return json.dumps(
-            {
+        for standard_id in ids_to_fetch:
+            responses[standard_id] = {
                 "success": False,
                 "results": [],
                 "message": f"Pinecone API error: {str(e)}",
                 "error_type": "api_error",
             }
-        )
+        return responses
     except Exception as e:
-        return json.dumps(
-            {
+        for standard_id in ids_to_fetch:
+            responses[standard_id] = {
                 "success": False,
                 "results": [],
                 "message": f"Unexpected error: {str(e)}",
                 "error_type": "api_error",
             }
-        )
+        return responses
+
+    for standard_id in ids_to_fetch:
+        record = fetched.get(standard_id.strip())
+        if record is None:
+            responses[standard_id] = {
+                "success": False,
+                "results": [],
+                "message": f"Standard with GUID '{standard_id}' not found. This function only accepts GUIDs (e.g., 'EA60C8D165F6481B90BFF782CE193F93'). For statement notations or other identifiers, use find_relevant_standards with a keyword search instead.",
+                "error_type": "not_found",
+            }
+        else:
+            responses[standard_id] = {
+                "success": True,
+                "results": [record],
+                "message": "Retrieved standard details",
+            }
+
+    return responses
+
+
+def get_standard_details_impl(standard_id: str, pretty: bool = False) -> str:
+    """
+    Implementation of direct standard lookup by GUID only.
+
+    JSON-string wrapper around get_standard_details_dict for callers that
+    serve the response directly (e.g., the MCP tool endpoint). Output is
+    compact by default; indentation only pads the payload on the wire.
+
+    Args:
+        standard_id: The standard's GUID (_id field) - must be a valid GUID format
+            (e.g., "EA60C8D165F6481B90BFF782CE193F93")
+        pretty: Indent the JSON for human readability (default: False)
+
+    Returns:
+        JSON string with structured response containing standard details
+    """
+    return orjson.dumps(
+        get_standard_details_dict(standard_id),
+        option=orjson.OPT_INDENT_2 if pretty else 0,
+    ).decode()
 
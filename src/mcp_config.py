@@ -19,6 +19,20 @@ class McpSettings(BaseSettings):
     pinecone_api_key: str = ""
     pinecone_index_name: str = "common-core-standards"
     pinecone_namespace: str = "standards"
+    pinecone_max_concurrent_upserts: int = 4
+    pinecone_max_concurrent_searches: int = 4
+    # Target upsert requests per second; 0 disables client-side pacing
+    # (backoff on 429 still applies)
+    pinecone_upsert_rps: float = 0.0
+    # Approximate REST payload budget per upsert request; batches close
+    # early rather than exceed it
+    pinecone_max_upsert_payload_bytes: int = 1_900_000
+    # Maximum IDs per fetch request (Pinecone caps fetch at 1000 IDs)
+    pinecone_fetch_batch_size: int = 1000
+
+    # Optional SQLite file for persisting search-cache entries across
+    # restarts; empty string disables persistence
+    search_cache_path: str = ""
 
 
 _settings: McpSettings | None = None
@@ -2,25 +2,103 @@
 
 from __future__ import annotations
 
+import hashlib
+import os
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import Any
 
+import orjson
 from loguru import logger
 from pinecone import Pinecone
 from pinecone.exceptions import PineconeException
 
 from src.mcp_config import get_mcp_settings
+from src.query_cache import QueryCache
 from tools.pinecone_models import PineconeRecord
 
 settings = get_mcp_settings()
 
+# Shared result cache for search_standards; invalidated when uploads change
+# the index so stale hits don't survive data changes. Starts warm from the
+# configured SQLite file when persistence is enabled.
+_search_cache = QueryCache(
+    persist_path=Path(settings.search_cache_path) if settings.search_cache_path else None
+)
+
+def _upsert_records(index: Any, namespace: str, records: list[dict[str, Any]]) -> Any:
+    """Issue one upsert request; module-level so retries capture only args."""
+    return index.upsert_records(namespace=namespace, records=records)
+
+
+# Decorrelated-jitter retry window (seconds): first retry draws from
+# [base, 3*base], later ones widen from the previous draw up to the cap
+_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 60.0
+
+# (field name, serialization alias) pairs computed once from the model, so
+# the upsert hot loop serializes with plain attribute gets instead of
+# running Pydantic's dump machinery per record
+_RECORD_FIELDS: tuple[tuple[str, str], ...] = tuple(
+    (name, field.serialization_alias or name)
+    for name, field in PineconeRecord.model_fields.items()
+)
+
+
+class RateLimiter:
+    """
+    Token-bucket rate limiter for outbound requests.
+
+    Tokens refill continuously at the configured rate (monotonic clock),
+    so callers only sleep when they actually exceed the target RPS —
+    under-utilized runs pay no fixed per-request tax. Thread-safe, so one
+    limiter can pace the concurrent upsert pool.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None) -> None:
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate: Sustained requests per second
+            burst: Bucket capacity (defaults to one second's worth of
+                tokens, minimum 1)
+        """
+        self.rate = rate
+        self.capacity = burst if burst is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Take one token, sleeping until one is available."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity,
+                    self._tokens + (now - self._updated_at) * self.rate,
+                )
+                self._updated_at = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.rate
+            time.sleep(wait)
+
 
 class PineconeClient:
     """Client for interacting with Pinecone index."""
 
+    # Seconds to trust a cached has_index result before re-checking
+    _HAS_INDEX_TTL = 60.0
+
     def __init__(self) -> None:
         """Initialize Pinecone SDK from config settings."""
         api_key = settings.pinecone_api_key
@@ -31,6 +109,14 @@ class PineconeClient:
         self.index_name = settings.pinecone_index_name
         self.namespace = settings.pinecone_namespace
         self._index = None
+        self._has_index_checked_at: float | None = None
+        self._has_index_result = False
+        # Optional upsert pacing; unset means no pacing beyond 429 backoff
+        self._upsert_limiter = (
+            RateLimiter(settings.pinecone_upsert_rps)
+            if settings.pinecone_upsert_rps > 0
+            else None
+        )
 
     @property
     def index(self):
@@ -39,6 +125,27 @@ class PineconeClient:
             self._index = self.pc.Index(self.index_name)
         return self._index
 
+    def _has_index(self) -> bool:
+        """
+        Check index existence with a short-lived cache.
+
+        has_index is a synchronous control-plane round-trip; callers hit the
+        validate/ensure paths often enough in long-running processes that a
+        short TTL removes most of those calls. The cache is updated directly
+        when this client creates the index.
+
+        Returns:
+            True if the configured index exists.
+        """
+        now = time.monotonic()
+        if (
+            self._has_index_checked_at is None
+            or now - self._has_index_checked_at > self._HAS_INDEX_TTL
+        ):
+            self._has_index_result = self.pc.has_index(name=self.index_name)
+            self._has_index_checked_at = now
+        return self._has_index_result
+
     def validate_index(self) -> None:
         """
         Check index exists with pc.has_index(), raise helpful error if not.
@@ -46,7 +153,7 @@ class PineconeClient:
         Raises:
             ValueError: If index does not exist, with instructions to create it.
         """
-        if not self.pc.has_index(name=self.index_name):
+        if not self._has_index():
             raise ValueError(
                 f"Index '{self.index_name}' not found. Create it with:\n"
                 f"pc index create -n {self.index_name} -m cosine -c aws -r us-east-1 "
@@ -62,7 +169,7 @@ class PineconeClient:
         Returns:
             True if index was created, False if it already existed.
         """
-        if self.pc.has_index(name=self.index_name):
+        if self._has_index():
             logger.info(f"Index '{self.index_name}' already exists")
             return False
 
@@ -77,6 +184,10 @@ class PineconeClient:
             },
         )
         logger.info(f"Successfully created index '{self.index_name}'")
+
+        # The index now exists; refresh the cache instead of re-querying
+        self._has_index_result = True
+        self._has_index_checked_at = time.monotonic()
         return True
 
     def get_index_stats(self) -> dict[str, Any]:
@@ -92,12 +203,43 @@ class PineconeClient:
             "namespaces": dict(stats.namespaces) if stats.namespaces else {},
         }
 
+    @staticmethod
+    def _retry_delay(e: PineconeException | None, prev_delay: float) -> float:
+        """
+        Compute the sleep before the next retry attempt.
+
+        A Retry-After header from the server takes precedence. Otherwise the
+        delay uses decorrelated jitter — uniform over [base, min(cap,
+        prev_delay * 3)] — so concurrent callers hitting the same 429/5xx
+        spread out instead of waking together, and repeated failures still
+        grow the window.
+
+        Args:
+            e: The triggering exception, if it may carry a Retry-After header
+            prev_delay: Delay used for the previous attempt (seed with
+                _BACKOFF_BASE on the first retry)
+
+        Returns:
+            Delay in seconds
+        """
+        headers = getattr(e, "headers", None) if e is not None else None
+        if headers:
+            try:
+                return float(headers.get("Retry-After"))
+            except (TypeError, ValueError):
+                pass
+
+        return random.uniform(_BACKOFF_BASE, min(_BACKOFF_CAP, prev_delay * 3))
+
     @staticmethod
     def exponential_backoff_retry(
         func: Callable[[], Any], max_retries: int = 5
     ) -> Any:
         """
-        Retry function with exponential backoff on 429/5xx, fail on 4xx.
+        Retry function with full-jitter exponential backoff on 429/5xx, fail on 4xx.
+
+        Transient network failures (ConnectionError/TimeoutError) are retried
+        the same way as retryable API errors.
 
         Args:
             func: Function to retry (should be a callable that takes no args)
@@ -109,6 +251,7 @@ class PineconeClient:
         Raises:
             PineconeException: If retries exhausted or non-retryable error
         """
+        prev_delay = _BACKOFF_BASE
         for attempt in range(max_retries):
             try:
                 return func()
@@ -117,10 +260,15 @@ class PineconeClient:
                 # Only retry transient errors
                 if status_code and (status_code >= 500 or status_code == 429):
                     if attempt < max_retries - 1:
-                        delay = min(2 ** attempt, 60)  # Cap at 60s
+                        delay = prev_delay = PineconeClient._retry_delay(
+                            e, prev_delay
+                        )
                         logger.warning(
-                            f"Retryable error (status {status_code}), "
-                            f"retrying in {delay}s (attempt {attempt + 1}/{max_retries})"
+                            "Retryable error (status {}), retrying in {:.1f}s (attempt {}/{})",
+                            status_code,
+                            delay,
+                            attempt + 1,
+                            max_retries,
                         )
                         time.sleep(delay)
                     else:
@@ -132,53 +280,218 @@ class PineconeClient:
                     # Don't retry client errors
                     logger.error(f"Non-retryable error (status {status_code}): {e}")
                     raise
+            except (ConnectionError, TimeoutError) as e:
+                if attempt < max_retries - 1:
+                    delay = prev_delay = PineconeClient._retry_delay(
+                        None, prev_delay
+                    )
+                    logger.warning(
+                        "Transient network error ({}), retrying in {:.1f}s (attempt {}/{})",
+                        e,
+                        delay,
+                        attempt + 1,
+                        max_retries,
+                    )
+                    time.sleep(delay)
+                else:
+                    logger.error(
+                        f"Max retries ({max_retries}) exceeded for network error"
+                    )
+                    raise
             except Exception as e:
-                # Non-Pinecone exceptions should not be retried
+                # Other non-Pinecone exceptions should not be retried
                 logger.error(f"Non-retryable exception: {e}")
                 raise
 
     def batch_upsert(
-        self, records: list[PineconeRecord], batch_size: int = 96
+        self,
+        records: list[PineconeRecord],
+        batch_size: int = 96,
+        max_concurrent: int | None = None,
+        set_dir: Path | None = None,
+        force: bool = False,
     ) -> None:
         """
-        Upsert records in batches of specified size with rate limiting.
+        Upsert records in batches, dispatching batches concurrently.
+
+        Each batch is an independent upsert request, so batches run on a
+        bounded thread pool instead of strictly serially. Pacing comes from
+        the backoff-on-429 retry rather than a fixed sleep between batches.
+
+        When set_dir is given, a .pinecone_hashes sidecar tracks a content
+        hash per record so reruns skip records that haven't changed since
+        the last upload; force bypasses the skip.
 
         Args:
             records: List of PineconeRecord objects to upsert
             batch_size: Number of records per batch (default: 96)
+            max_concurrent: Maximum in-flight upsert requests (defaults to
+                settings.pinecone_max_concurrent_upserts)
+            set_dir: Standard set directory holding the hash sidecar; None
+                disables change detection
+            force: Upsert every record even if its hash is unchanged
+
+        Raises:
+            PineconeException: If any batch fails after retries
         """
+        new_hashes: dict[str, str] | None = None
+        if set_dir is not None:
+            new_hashes = {
+                record.id: self._content_hash(record.content) for record in records
+            }
+            if not force:
+                previous_hashes = self._load_upload_hashes(set_dir)
+                unchanged = sum(
+                    1
+                    for record_id, content_hash in new_hashes.items()
+                    if previous_hashes.get(record_id) == content_hash
+                )
+                if unchanged:
+                    logger.info(
+                        "Skipping {} unchanged record(s) from previous upload", unchanged
+                    )
+                    records = [
+                        record
+                        for record in records
+                        if previous_hashes.get(record.id) != new_hashes[record.id]
+                    ]
+
         if not records:
             logger.info("No records to upsert")
             return
 
-        total_batches = (len(records) + batch_size - 1) // batch_size
+        if max_concurrent is None:
+            max_concurrent = settings.pinecone_max_concurrent_upserts
+
         logger.info(
-            f"Upserting {len(records)} records in {total_batches} batch(es) "
-            f"(batch size: {batch_size})"
+            "Upserting {} records (max batch size: {}, max concurrent: {})",
+            len(records),
+            batch_size,
+            max_concurrent,
         )
 
-        for i in range(0, len(records), batch_size):
-            batch = records[i : i + batch_size]
-            batch_num = (i // batch_size) + 1
-
-            # Convert PineconeRecord models to dict format for Pinecone
-            batch_dicts = [self._record_to_dict(record) for record in batch]
+        def upsert_batch(batch_dicts: list[dict[str, Any]], batch_num: int) -> None:
+            # lazy=True defers argument evaluation and message formatting
+            # until the DEBUG sink is actually enabled, so batches don't
+            # pay for string formatting on quiet runs
+            logger.opt(lazy=True).debug(
+                "Upserting batch {} ({} records)",
+                lambda: batch_num,
+                lambda: len(batch_dicts),
+            )
 
-            logger.debug(f"Upserting batch {batch_num}/{total_batches} ({len(batch)} records)")
+            if self._upsert_limiter is not None:
+                self._upsert_limiter.acquire()
 
-            # Retry with exponential backoff
+            # Retry with exponential backoff; partial over the module-level
+            # helper instead of a closure, so nothing beyond the arguments
+            # themselves is captured across long backoff sleeps
             self.exponential_backoff_retry(
-                lambda b=batch_dicts: self.index.upsert_records(
-                    namespace=self.namespace, records=b
-                )
+                partial(_upsert_records, self.index, self.namespace, batch_dicts)
             )
 
-            # Rate limiting between batches
-            if i + batch_size < len(records):
-                time.sleep(0.1)
+        # Batches are serialized lazily and submitted as they close, so
+        # dict conversion of later batches overlaps the network round-trips
+        # of earlier ones instead of running entirely up front
+        batch_iter = self._iter_batches(
+            records, batch_size, settings.pinecone_max_upsert_payload_bytes
+        )
+        with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+            futures = [
+                executor.submit(upsert_batch, batch_dicts, batch_num)
+                for batch_num, batch_dicts in enumerate(batch_iter, 1)
+            ]
+            # Surface the first failure; remaining futures finish or are
+            # abandoned when the executor shuts down
+            for future in as_completed(futures):
+                future.result()
 
         logger.info(f"Successfully upserted {len(records)} records")
 
+        # Record hashes only after every batch succeeded, so a failed run
+        # doesn't mark records as uploaded
+        if set_dir is not None and new_hashes is not None:
+            self._write_upload_hashes(set_dir, new_hashes)
+
+        # Cached search results may reference pre-upsert data
+        _search_cache.invalidate()
+
+    @staticmethod
+    def _content_hash(content: str) -> str:
+        """Short, stable hash of record content for change detection."""
+        return hashlib.blake2b(content.encode("utf-8"), digest_size=8).hexdigest()
+
+    @staticmethod
+    def _load_upload_hashes(set_dir: Path) -> dict[str, str]:
+        """
+        Load the record-hash sidecar from a previous upload.
+
+        Returns:
+            Dict mapping record ID to content hash; empty if the sidecar
+            is missing or unreadable.
+        """
+        sidecar = set_dir / ".pinecone_hashes"
+        try:
+            return orjson.loads(sidecar.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning("Failed to read upload hashes {}: {}", sidecar, e)
+            return {}
+
+    @staticmethod
+    def _write_upload_hashes(set_dir: Path, hashes: dict[str, str]) -> None:
+        """Atomically replace the record-hash sidecar after an upload."""
+        sidecar = set_dir / ".pinecone_hashes"
+        tmp_path = sidecar.with_suffix(".tmp")
+        tmp_path.write_bytes(orjson.dumps(hashes))
+        os.replace(tmp_path, sidecar)
+
+    @classmethod
+    def _iter_batches(
+        cls,
+        records: list[PineconeRecord],
+        max_records: int,
+        max_payload_bytes: int,
+    ):
+        """
+        Lazily convert records and yield upsert batches as they close.
+
+        A batch closes when it reaches max_records (Pinecone caps
+        integrated-embedding upserts at 96 records per request) or when
+        adding another record would push its approximate serialized size
+        past max_payload_bytes, whichever comes first. Yielding batches as
+        they close lets the caller start upserting while later records are
+        still being converted.
+
+        Args:
+            records: PineconeRecord instances to convert
+            max_records: Maximum records per batch
+            max_payload_bytes: Approximate serialized-size budget per batch
+
+        Yields:
+            Batches of record dicts ready for upsert_records
+        """
+        current: list[dict[str, Any]] = []
+        current_bytes = 0
+
+        for record in records:
+            record_dict = cls._record_to_dict(record)
+            record_bytes = len(orjson.dumps(record_dict))
+            if current and (
+                len(current) >= max_records
+                or current_bytes + record_bytes > max_payload_bytes
+            ):
+                yield current
+                current = []
+                current_bytes = 0
+
+            current.append(record_dict)
+            current_bytes += record_bytes
+
+        if current:
+            yield current
+
     @staticmethod
     def _record_to_dict(record: PineconeRecord) -> dict[str, Any]:
         """
@@ -194,25 +507,15 @@ class PineconeClient:
         Returns:
             Dictionary ready for Pinecone upsert_records
         """
-        # Use by_alias=True to serialize 'id' as '_id' per model serialization_alias
-        record_dict = record.model_dump(exclude_none=False, by_alias=True)
-
-        # Remove None values for optional fields
-        optional_fields = {
-            "asn_identifier",
-            "statement_notation",
-            "statement_label",
-            "normalized_subject",
-            "publication_status",
-            "parent_id",  # Must be omitted when None (Pinecone doesn't accept null)
-            "document_id",
-            "document_valid",
+        # Equivalent to model_dump(by_alias=True, exclude_none=True) but via
+        # tight attribute gets over the precomputed field table; dropping
+        # None values omits unset optional fields (including parent_id on
+        # root nodes), which Pinecone requires.
+        return {
+            alias: value
+            for name, alias in _RECORD_FIELDS
+            if (value := getattr(record, name)) is not None
         }
-        for field in optional_fields:
-            if record_dict.get(field) is None:
-                record_dict.pop(field, None)
-
-        return record_dict
 
     def search_standards(
         self,
@@ -231,26 +534,53 @@ class PineconeClient:
         Returns:
             List of result dictionaries with metadata and scores
         """
-        # Build filter dictionary dynamically
-        # Always filter to only leaf nodes (actual standards, not parent categories)
-        filter_parts = [{"is_leaf": {"$eq": True}}]
-        
-        if grade:
-            filter_parts.append({"education_levels": {"$in": [grade]}})
+        # Serve repeat queries from the cache before paying for the
+        # embed + ANN + rerank round-trip
+        cached = _search_cache.get(query_text, top_k, grade)
+        if cached is not None:
+            logger.debug("Search cache hit for query: {}", query_text)
+            return cached
+
+        parsed_results = self._do_search(query_text, top_k, grade)
+        _search_cache.put(query_text, top_k, grade, parsed_results)
+        return parsed_results
 
-        filter_dict = None
-        if len(filter_parts) == 1:
-            filter_dict = filter_parts[0]
-        elif len(filter_parts) == 2:
-            filter_dict = {"$and": filter_parts}
+    def _do_search(
+        self,
+        query_text: str,
+        top_k: int,
+        grade: str | None,
+    ) -> list[dict]:
+        """
+        Issue a single search request and parse the hits (no caching).
+
+        Args:
+            query_text: Natural language query
+            top_k: Maximum number of results
+            grade: Optional grade filter
+
+        Returns:
+            List of result dictionaries with metadata and scores
+        """
+        # Build filter dictionary in one expression.
+        # Always filter to only leaf nodes (actual standards, not parent categories)
+        filter_dict = (
+            {
+                "$and": [
+                    {"is_leaf": {"$eq": True}},
+                    {"education_levels": {"$in": [grade]}},
+                ]
+            }
+            if grade
+            else {"is_leaf": {"$eq": True}}
+        )
 
         # Build query dictionary
         query_dict: dict[str, Any] = {
             "inputs": {"text": query_text},
             "top_k": top_k * 2,  # Get more candidates for reranking
+            "filter": filter_dict,
         }
-        if filter_dict:
-            query_dict["filter"] = filter_dict
 
         # Call search with reranking
         results = self.index.search(
@@ -272,6 +602,50 @@ class PineconeClient:
 
         return parsed_results
 
+    def search_standards_batch(
+        self,
+        queries: list[tuple[str, int, str | None]],
+    ) -> list[list[dict]]:
+        """
+        Run multiple searches, overlapping the network round-trips.
+
+        Cache hits are answered inline; only misses are dispatched to a
+        bounded thread pool, so a batch of N unique queries costs roughly
+        one round-trip of latency instead of N. Useful when a single MCP
+        interaction asks about several activities at once.
+
+        Args:
+            queries: List of (query_text, top_k, grade) tuples
+
+        Returns:
+            Result lists in the same order as the input queries
+        """
+        results: list[list[dict] | None] = [None] * len(queries)
+        # Misses grouped by normalized cache key, so duplicate queries in
+        # one batch share a single request
+        misses: dict[tuple[str, int, str | None], list[int]] = {}
+        for i, (query_text, top_k, grade) in enumerate(queries):
+            cached = _search_cache.get(query_text, top_k, grade)
+            if cached is not None:
+                results[i] = cached
+            else:
+                misses.setdefault(QueryCache.make_key(query_text, top_k, grade), []).append(i)
+
+        if misses:
+            max_workers = min(len(misses), settings.pinecone_max_concurrent_searches)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = {
+                    executor.submit(self._do_search, *queries[indices[0]]): indices
+                    for indices in misses.values()
+                }
+                for future, indices in futures.items():
+                    parsed = future.result()
+                    _search_cache.put(*queries[indices[0]], parsed)
+                    for i in indices:
+                        results[i] = parsed
+
+        return results
+
     def fetch_standard(self, standard_id: str) -> dict | None:
         """
         Fetch a standard by its GUID (_id field only).
@@ -287,62 +661,111 @@ class PineconeClient:
         Returns:
             Standard dictionary with metadata, or None if not found
         """
-        result = self.index.fetch(ids=[standard_id], namespace=self.namespace)
+        return self.fetch_standards([standard_id]).get(standard_id)
 
-        # Extract vectors from FetchResponse
-        # FetchResponse.vectors is a dict mapping ID to Vector objects
-        vectors = result.vectors
-        
-        if not vectors or standard_id not in vectors:
-            return None
+    def fetch_standards(self, standard_ids: list[str]) -> dict[str, dict]:
+        """
+        Fetch multiple standards by GUID in batched requests.
 
-        vector = vectors[standard_id]
-        
-        # Extract metadata from Vector object
-        # Vector has: id, values (embedding), and metadata (dict with all fields)
-        metadata = vector.metadata or {}
-        vector_id = vector.id
-
-        # Combine _id with all metadata fields
-        record_dict = {
-            "_id": vector_id,
-            **metadata,
-        }
+        Pinecone's fetch endpoint accepts up to 1000 IDs per call, so this
+        collapses N individual round-trips into ceil(N/batch) requests.
+        Like fetch_standard, this only works with GUIDs (_id field), not
+        statement notations.
+
+        Args:
+            standard_ids: Standard GUIDs (_id field) to fetch
+
+        Returns:
+            Dict mapping each found GUID to its standard dictionary.
+            GUIDs that were not found are omitted from the result.
+        """
+        if not standard_ids:
+            return {}
+
+        batch_size = settings.pinecone_fetch_batch_size
+        records: dict[str, dict] = {}
+        for start in range(0, len(standard_ids), batch_size):
+            chunk = list(standard_ids[start : start + batch_size])
+            result = self.exponential_backoff_retry(
+                lambda chunk=chunk: self.index.fetch(
+                    ids=chunk, namespace=self.namespace
+                )
+            )
+            for vector_id, vector in (result.vectors or {}).items():
+                metadata = vector.metadata or {}
+                records[vector_id] = {"_id": vector_id, **metadata}
 
-        return record_dict
+        return records
 
     @staticmethod
     def is_uploaded(set_dir: Path) -> bool:
         """
         Check for .pinecone_uploaded marker file.
 
+        Uses os.path.lexists to skip the symlink-following stat; catalog
+        scans call this once per set directory.
+
         Args:
             set_dir: Path to standard set directory
 
         Returns:
             True if marker file exists, False otherwise
         """
-        marker_file = set_dir / ".pinecone_uploaded"
-        return marker_file.exists()
+        return os.path.lexists(str(set_dir / ".pinecone_uploaded"))
 
     @staticmethod
     def mark_uploaded(set_dir: Path) -> None:
         """
         Create marker file with ISO 8601 timestamp.
 
+        Written via raw os.open/os.write: the payload is a ~30-byte ASCII
+        timestamp, so the buffered io layer is pure overhead on bulk runs.
+
         Args:
             set_dir: Path to standard set directory
         """
         marker_file = set_dir / ".pinecone_uploaded"
-        timestamp = datetime.now(timezone.utc).isoformat()
-        marker_file.write_text(timestamp, encoding="utf-8")
-        logger.debug(f"Created upload marker: {marker_file}")
+        payload = datetime.now(timezone.utc).isoformat().encode("ascii")
+        PineconeClient._write_marker(marker_file, payload)
+        logger.debug("Created upload marker: {}", marker_file)
+
+    @staticmethod
+    def mark_uploaded_bulk(set_dirs: Iterable[Path]) -> None:
+        """
+        Create upload markers for many set directories in one pass.
+
+        The timestamp payload is built once and shared across every marker,
+        so a batch run pays one datetime/isoformat and one bytes object
+        total instead of one per directory.
+
+        Args:
+            set_dirs: Standard set directories to mark
+        """
+        payload = datetime.now(timezone.utc).isoformat().encode("ascii")
+        count = 0
+        for set_dir in set_dirs:
+            PineconeClient._write_marker(set_dir / ".pinecone_uploaded", payload)
+            count += 1
+        logger.debug("Created {} upload markers", count)
+
+    @staticmethod
+    def _write_marker(marker_file: Path, payload: bytes) -> None:
+        """Write a marker file via raw os.open/os.write (tiny ASCII payload)."""
+        fd = os.open(str(marker_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, payload)
+        finally:
+            os.close(fd)
 
     @staticmethod
     def get_upload_timestamp(set_dir: Path) -> str | None:
         """
         Read timestamp from marker file.
 
+        Reads via raw os.open/os.read (timestamps are short ASCII), and
+        relies on FileNotFoundError instead of a separate existence check
+        so the common case costs a single syscall pair.
+
         Args:
             set_dir: Path to standard set directory
 
@@ -350,12 +773,156 @@ class PineconeClient:
             ISO 8601 timestamp string if marker exists, None otherwise
         """
         marker_file = set_dir / ".pinecone_uploaded"
-        if not marker_file.exists():
+        try:
+            fd = os.open(str(marker_file), os.O_RDONLY)
+        except FileNotFoundError:
             return None
 
         try:
-            return marker_file.read_text(encoding="utf-8").strip()
+            return os.read(fd, 64).decode("ascii").strip()
         except Exception as e:
             logger.warning(f"Failed to read upload marker {marker_file}: {e}")
             return None
+        finally:
+            os.close(fd)
+
+    @staticmethod
+    def scan_upload_markers(root: Path) -> dict[Path, str | None]:
+        """
+        Scan all set directories under root for upload markers in one pass.
+
+        Callers that enumerate a whole catalog with per-directory
+        is_uploaded/get_upload_timestamp calls pay a stat per directory
+        plus repeated directory-entry lookups. A single os.scandir walk
+        amortizes those syscalls and benefits from dentry cache locality.
+
+        Args:
+            root: Directory whose immediate subdirectories are set dirs
+
+        Returns:
+            Dict mapping each set directory to its upload timestamp, or
+            None for directories that have not been uploaded.
+        """
+        states: dict[Path, str | None] = {}
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                set_dir = Path(entry.path)
+                states[set_dir] = PineconeClient.get_upload_timestamp(set_dir)
+        return states
+
+
+class RecordBatcher:
+    """
+    Aggregate records from multiple standard sets into shared upsert batches.
+
+    Uploading set-by-set pays a full upsert round-trip per set even when a
+    set only holds a handful of records. The batcher buffers records across
+    sets and flushes whenever the buffer reaches batch_size, so small sets
+    ride along in near-full requests. Per-set bookkeeping — the content-hash
+    sidecar and an optional completion callback — fires only once every
+    record of that set has been flushed successfully.
+    """
+
+    def __init__(self, client: PineconeClient, batch_size: int = 96) -> None:
+        self.client = client
+        self.batch_size = batch_size
+        self._buffer: list[PineconeRecord] = []
+        self._buffer_owners: list[str] = []
+        self._pending: dict[str, int] = {}
+        self._set_state: dict[
+            str, tuple[Path | None, dict[str, str] | None, Callable[[], None] | None]
+        ] = {}
+
+    def add_set(
+        self,
+        set_id: str,
+        records: list[PineconeRecord],
+        set_dir: Path | None = None,
+        force: bool = False,
+        on_complete: Callable[[], None] | None = None,
+    ) -> int:
+        """
+        Queue a set's records, flushing full batches as the buffer fills.
+
+        When set_dir is given, records whose content hash matches the
+        previous upload are dropped up front (unless force), mirroring
+        batch_upsert's change detection.
+
+        Returns:
+            Number of records queued after change detection.
+        """
+        new_hashes: dict[str, str] | None = None
+        if set_dir is not None:
+            new_hashes = {
+                record.id: self.client._content_hash(record.content)
+                for record in records
+            }
+            if not force:
+                previous_hashes = self.client._load_upload_hashes(set_dir)
+                records = [
+                    record
+                    for record in records
+                    if previous_hashes.get(record.id) != new_hashes[record.id]
+                ]
+
+        self._set_state[set_id] = (set_dir, new_hashes, on_complete)
+        self._pending[set_id] = len(records)
+        if not records:
+            # Everything unchanged since the last upload; complete directly
+            self._complete(set_id)
+            return 0
+
+        for record in records:
+            self._buffer.append(record)
+            self._buffer_owners.append(set_id)
+            if len(self._buffer) >= self.batch_size:
+                self._flush_buffer()
+        return len(records)
+
+    def flush(self) -> None:
+        """Upsert any records still buffered and fire their completions."""
+        if self._buffer:
+            self._flush_buffer()
+
+    def _flush_buffer(self) -> None:
+        chunk = self._buffer
+        owners = self._buffer_owners
+        self._buffer = []
+        self._buffer_owners = []
+        self.client.batch_upsert(chunk, batch_size=self.batch_size)
+        for set_id in owners:
+            self._pending[set_id] -= 1
+            if self._pending[set_id] == 0:
+                self._complete(set_id)
+
+    def _complete(self, set_id: str) -> None:
+        set_dir, new_hashes, on_complete = self._set_state.pop(set_id)
+        self._pending.pop(set_id, None)
+        if set_dir is not None and new_hashes is not None:
+            self.client._write_upload_hashes(set_dir, new_hashes)
+        if on_complete is not None:
+            on_complete()
+
+
+_client: PineconeClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_pinecone_client() -> PineconeClient:
+    """
+    Get the singleton PineconeClient instance.
+
+    Constructing a PineconeClient re-initializes the SDK's HTTP client and
+    re-resolves the index handle, so callers on the request hot path should
+    share one instance instead of constructing their own. Initialization is
+    double-checked under a lock because tool calls run on a thread pool.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = PineconeClient()
+    return _client
 
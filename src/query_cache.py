@@ -0,0 +1,230 @@
+"""Thread-safe LRU+TTL cache for semantic search results."""
+
+from __future__ import annotations
+
+import queue
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+import orjson
+from loguru import logger
+
+# Characters stripped during key normalization. Queries like "Teaching
+# fractions!" and "teaching, fractions" should share a cache entry.
+_PUNCTUATION_RE = re.compile(r"[^\w\s-]")
+
+# Write-queue sentinel asking the writer thread to drop all persisted rows
+_CLEAR = object()
+
+
+class QueryCache:
+    """
+    Process-local LRU cache with TTL for search results.
+
+    The search path is network-bound: every query re-runs Pinecone's
+    integrated embedding, ANN lookup, and reranking even for repeated
+    queries, which are common in MCP workloads. Entries are keyed by
+    normalized (query_text, top_k, grade) so trivial rephrasings still
+    hit, and carry a TTL so results don't outlive index changes for long.
+
+    All operations are guarded by an RLock, so one instance can be shared
+    across the tool-dispatch thread pool.
+
+    When persist_path is set, entries are also mirrored to a SQLite file
+    so the cache starts warm after a restart. Persistence is write-behind:
+    put() enqueues to a background daemon thread that batches INSERTs into
+    single transactions, so the search hot path never waits on disk.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 2000,
+        ttl_seconds: float = 300.0,
+        persist_path: Path | None = None,
+    ) -> None:
+        """
+        Initialize the cache, rehydrating from disk if persistence is enabled.
+
+        Args:
+            max_size: Maximum number of entries before LRU eviction
+            ttl_seconds: Seconds after which a cached entry expires
+            persist_path: Optional SQLite file used to warm the cache
+                across restarts; None disables persistence
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.RLock()
+        self._entries: OrderedDict[tuple[str, int, str | None], tuple[float, Any]] = (
+            OrderedDict()
+        )
+        self._hits = 0
+        self._misses = 0
+
+        self._persist_path = Path(persist_path) if persist_path is not None else None
+        self._write_queue: queue.Queue | None = None
+        if self._persist_path is not None:
+            self._load_persisted()
+            self._write_queue = queue.Queue()
+            threading.Thread(
+                target=self._writer_loop,
+                name="query-cache-writer",
+                daemon=True,
+            ).start()
+
+    @staticmethod
+    def make_key(
+        query_text: str, top_k: int, grade: str | None
+    ) -> tuple[str, int, str | None]:
+        """
+        Build a normalized cache key.
+
+        Normalization lowercases, strips punctuation, and collapses
+        whitespace so trivially rephrased queries map to the same entry.
+        """
+        normalized = _PUNCTUATION_RE.sub("", query_text.lower())
+        return (" ".join(normalized.split()), top_k, grade)
+
+    def get(self, query_text: str, top_k: int, grade: str | None) -> Any | None:
+        """
+        Look up a cached value, expiring stale entries on access.
+
+        Returns:
+            The cached value, or None on a miss or expired entry.
+        """
+        key = self.make_key(query_text, top_k, grade)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+
+            inserted_at, value = entry
+            if now - inserted_at > self.ttl_seconds:
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, query_text: str, top_k: int, grade: str | None, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        key = self.make_key(query_text, top_k, grade)
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+        if self._write_queue is not None:
+            self._write_queue.put(
+                (orjson.dumps(list(key)).decode(), time.time(), orjson.dumps(value))
+            )
+
+    def invalidate(self) -> None:
+        """Drop all entries (e.g., after an upsert changes the index)."""
+        with self._lock:
+            self._entries.clear()
+        if self._write_queue is not None:
+            self._write_queue.put(_CLEAR)
+
+    def flush(self) -> None:
+        """Block until all queued persistence writes have hit disk."""
+        if self._write_queue is not None:
+            self._write_queue.join()
+
+    def stats(self) -> dict[str, int]:
+        """Return hit/miss/size counters for observability."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._entries),
+            }
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the cache database, creating the schema on first use."""
+        conn = sqlite3.connect(self._persist_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, ts REAL, payload BLOB)"
+        )
+        return conn
+
+    def _load_persisted(self) -> None:
+        """
+        Rehydrate the LRU from the most recent persisted entries.
+
+        Persisted timestamps are wall-clock; each entry's age is mapped
+        back onto the monotonic clock so the normal TTL check applies,
+        and entries already past the TTL are skipped outright.
+        """
+        try:
+            conn = self._connect()
+            try:
+                rows = conn.execute(
+                    "SELECT key, ts, payload FROM cache ORDER BY ts DESC LIMIT ?",
+                    (self.max_size,),
+                ).fetchall()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logger.warning(f"Failed to load query cache from {self._persist_path}: {e}")
+            return
+
+        now_wall = time.time()
+        now_mono = time.monotonic()
+        # Oldest first, so the most recent entries end up most recently used
+        for key_text, ts, payload in reversed(rows):
+            age = now_wall - ts
+            if age > self.ttl_seconds:
+                continue
+            key = tuple(orjson.loads(key_text))
+            self._entries[key] = (now_mono - age, orjson.loads(payload))
+
+        if self._entries:
+            logger.debug(
+                f"Warmed query cache with {len(self._entries)} entries "
+                f"from {self._persist_path}"
+            )
+
+    def _writer_loop(self) -> None:
+        """
+        Drain queued writes into SQLite, batching into one transaction.
+
+        Runs on a daemon thread for the life of the process. Each wakeup
+        takes everything currently queued so bursts of puts become a
+        single INSERT transaction instead of per-entry commits.
+        """
+        conn = self._connect()
+        while True:
+            items = [self._write_queue.get()]
+            while True:
+                try:
+                    items.append(self._write_queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            try:
+                with conn:
+                    for item in items:
+                        if item is _CLEAR:
+                            conn.execute("DELETE FROM cache")
+                        else:
+                            conn.execute(
+                                "INSERT OR REPLACE INTO cache (key, ts, payload) "
+                                "VALUES (?, ?, ?)",
+                                item,
+                            )
+            except sqlite3.Error as e:
+                logger.warning(f"Query cache write-behind failed: {e}")
+            finally:
+                for _ in items:
+                    self._write_queue.task_done()
@@ -2,20 +2,23 @@
 
 from __future__ import annotations
 
-import json
-
+import orjson
 from pinecone.exceptions import PineconeException
 
-from src.pinecone_client import PineconeClient
+from src.pinecone_client import get_pinecone_client
 
 
-def find_relevant_standards_impl(
+def find_relevant_standards_dict(
     activity: str,
     max_results: int = 5,
     grade: str | None = None,
-) -> str:
+) -> dict:
     """
-    Implementation of semantic search over educational standards.
+    Implementation of semantic search over educational standards, returning a dict.
+
+    Callers that need the structured response (e.g., for display) should use
+    this directly to avoid a serialize/parse round-trip; find_relevant_standards_impl
+    wraps it for callers that need a JSON string.
 
     Args:
         activity: Description of the learning activity
@@ -23,22 +26,20 @@ def find_relevant_standards_impl(
         grade: Optional grade level filter (e.g., "K", "01", "05", "09")
 
     Returns:
-        JSON string with structured response containing matching standards
+        Dict with structured response containing matching standards
     """
     # Input validation
     if not activity or not activity.strip():
-        return json.dumps(
-            {
-                "success": False,
-                "results": [],
-                "message": "Activity description cannot be empty",
-                "error_type": "invalid_input",
-            }
-        )
+        return {
+            "success": False,
+            "results": [],
+            "message": "Activity description cannot be empty",
+            "error_type": "invalid_input",
+        }
 
     try:
-        # Initialize client and perform search
-        client = PineconeClient()
+        # Reuse the shared client to avoid per-call SDK initialization
+        client = get_pinecone_client()
         results = client.search_standards(
             query_text=activity.strip(),
             top_k=max_results,
@@ -47,40 +48,60 @@ def find_relevant_standards_impl(
 
         # Handle empty results
         if not results:
-            return json.dumps(
-                {
-                    "success": False,
-                    "results": [],
-                    "message": "No matching standards found",
-                    "error_type": "no_results",
-                }
-            )
+            return {
+                "success": False,
+                "results": [],
+                "message": "No matching standards found",
+                "error_type": "no_results",
+            }
 
         # Format successful results
-        response = {
+        return {
             "success": True,
             "results": results,
             "message": f"Found {len(results)} matching standards",
         }
 
-        return json.dumps(response, indent=2)
-
     except PineconeException as e:
-        return json.dumps(
-            {
-                "success": False,
-                "results": [],
-                "message": f"Pinecone API error: {str(e)}",
-                "error_type": "api_error",
-            }
-        )
+        return {
+            "success": False,
+            "results": [],
+            "message": f"Pinecone API error: {str(e)}",
+            "error_type": "api_error",
+        }
     except Exception as e:
-        return json.dumps(
-            {
-                "success": False,
-                "results": [],
-                "message": f"Unexpected error: {str(e)}",
-                "error_type": "api_error",
-            }
-        )
+        return {
+            "success": False,
+            "results": [],
+            "message": f"Unexpected error: {str(e)}",
+            "error_type": "api_error",
+        }
+
+
+def find_relevant_standards_impl(
+    activity: str,
+    max_results: int = 5,
+    grade: str | None = None,
+    pretty: bool = False,
+) -> str:
+    """
+    Implementation of semantic search over educational standards.
+
+    JSON-string wrapper around find_relevant_standards_dict for callers that
+    serve the response directly (e.g., the MCP tool endpoint). Output is
+    compact by default; indentation only pads the payload on the wire.
+
+    Args:
+        activity: Description of the learning activity
+        max_results: Maximum number of standards to return (default: 5)
+        grade: Optional grade level filter (e.g., "K", "01", "05", "09")
+        pretty: Indent the JSON for human readability (default: False)
+
+    Returns:
+        JSON string with structured response containing matching standards
+    """
+    return orjson.dumps(
+        find_relevant_standards_dict(activity, max_results, grade),
+        option=orjson.OPT_INDENT_2 if pretty else 0,
+    ).decode()
 
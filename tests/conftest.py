@@ -0,0 +1,102 @@
+"""Shared fixtures for the test suite."""
+
+from __future__ import annotations
+
+import pytest
+
+from tools.models import Standard, StandardSet
+from tools.pinecone_processor import StandardSetProcessor
+
+
+@pytest.fixture(scope="session")
+def sample_standard_set():
+    """Create a sample standard set for testing (shared across the session)."""
+    # Create a simple hierarchy:
+    # Root (depth 0): "Math"
+    #   Child (depth 1, notation "1.1"): "Numbers"
+    #     Child (depth 2, notation "1.1.A"): "Count to 10"
+    root_id = "ROOT_ID"
+    child1_id = "CHILD1_ID"
+    child2_id = "CHILD2_ID"
+
+    standards = {
+        root_id: Standard(
+            id=root_id,
+            position=100000,
+            depth=0,
+            description="Math",
+            statementLabel="Domain",
+            ancestorIds=[],
+            parentId=None,
+        ),
+        child1_id: Standard(
+            id=child1_id,
+            position=101000,
+            depth=1,
+            description="Numbers",
+            statementNotation="1.1",
+            statementLabel="Standard",
+            ancestorIds=[root_id],
+            parentId=root_id,
+        ),
+        child2_id: Standard(
+            id=child2_id,
+            position=102000,
+            depth=2,
+            description="Count to 10",
+            statementNotation="1.1.A",
+            statementLabel="Benchmark",
+            ancestorIds=[root_id, child1_id],
+            parentId=child1_id,
+        ),
+    }
+
+    standard_set = StandardSet(
+        id="SET_ID",
+        title="Grade 1",
+        subject="Mathematics",
+        normalizedSubject="Math",
+        educationLevels=["01"],
+        license={
+            "title": "CC BY",
+            "URL": "https://example.com",
+            "rightsHolder": "Test",
+        },
+        document={
+            "id": "DOC_ID",
+            "title": "Test Document",
+            "valid": "2021",
+            "publicationStatus": "Published",
+        },
+        jurisdiction={"id": "JUR_ID", "title": "Test State"},
+        standards=standards,
+    )
+
+    return standard_set
+
+
+@pytest.fixture(scope="session")
+def standards_dict(sample_standard_set):
+    """
+    Dump the sample standards to dicts once for the whole session.
+
+    Tests only read from this dict, so sharing it avoids re-running
+    model_dump on every Standard in every test.
+    """
+    return {
+        std_id: std.model_dump()
+        for std_id, std in sample_standard_set.standards.items()
+    }
+
+
+@pytest.fixture(scope="session")
+def ready_processor(sample_standard_set):
+    """
+    Processor with relationship maps already built, shared per session.
+
+    The hierarchy and content tests only read the processor's maps, so
+    one build replaces the per-test map reconstruction.
+    """
+    processor = StandardSetProcessor()
+    processor._build_relationship_maps(sample_standard_set.standards)
+    return processor
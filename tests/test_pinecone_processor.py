@@ -3,108 +3,21 @@
 from __future__ import annotations
 
 import json
-from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 
 from tools.models import Standard, StandardSet
+from tools.pinecone_models import PineconeRecord
 from tools.pinecone_processor import StandardSetProcessor, process_and_save
 
 
-@pytest.fixture
-def sample_standard_set():
-    """Create a sample standard set for testing."""
-    # Create a simple hierarchy:
-    # Root (depth 0): "Math"
-    #   Child (depth 1, notation "1.1"): "Numbers"
-    #     Child (depth 2, notation "1.1.A"): "Count to 10"
-    root_id = "ROOT_ID"
-    child1_id = "CHILD1_ID"
-    child2_id = "CHILD2_ID"
-
-    standards = {
-        root_id: Standard(
-            id=root_id,
-            position=100000,
-            depth=0,
-            description="Math",
-            statementLabel="Domain",
-            ancestorIds=[],
-            parentId=None,
-        ),
-        child1_id: Standard(
-            id=child1_id,
-            position=101000,
-            depth=1,
-            description="Numbers",
-            statementNotation="1.1",
-            statementLabel="Standard",
-            ancestorIds=[root_id],
-            parentId=root_id,
-        ),
-        child2_id: Standard(
-            id=child2_id,
-            position=102000,
-            depth=2,
-            description="Count to 10",
-            statementNotation="1.1.A",
-            statementLabel="Benchmark",
-            ancestorIds=[root_id, child1_id],
-            parentId=child1_id,
-        ),
-    }
-
-    standard_set = StandardSet(
-        id="SET_ID",
-        title="Grade 1",
-        subject="Mathematics",
-        normalizedSubject="Math",
-        educationLevels=["01"],
-        license={
-            "title": "CC BY",
-            "URL": "https://example.com",
-            "rightsHolder": "Test",
-        },
-        document={
-            "id": "DOC_ID",
-            "title": "Test Document",
-            "valid": "2021",
-            "publicationStatus": "Published",
-        },
-        jurisdiction={"id": "JUR_ID", "title": "Test State"},
-        standards=standards,
-    )
-
-    return standard_set
-
-
 class TestRelationshipMaps:
     """Test relationship map building (Task 3)."""
 
-    def test_build_id_to_standard_map(self, sample_standard_set):
-        """Test ID-to-standard map building."""
-        processor = StandardSetProcessor()
-        standards_dict = {
-            std_id: std.model_dump()
-            for std_id, std in sample_standard_set.standards.items()
-        }
-
-        result = processor._build_id_to_standard_map(standards_dict)
-
-        assert len(result) == 3
-        assert "ROOT_ID" in result
-        assert "CHILD1_ID" in result
-        assert "CHILD2_ID" in result
-        assert result["ROOT_ID"]["id"] == "ROOT_ID"
-
-    def test_build_parent_to_children_map(self, sample_standard_set):
+    def test_build_parent_to_children_map(self, standards_dict):
         """Test parent-to-children map building with position sorting."""
         processor = StandardSetProcessor()
-        standards_dict = {
-            std_id: std.model_dump()
-            for std_id, std in sample_standard_set.standards.items()
-        }
-
         result = processor._build_parent_to_children_map(standards_dict)
 
         # Root should have one child
@@ -122,76 +35,41 @@ class TestRelationshipMaps:
         # Child2 should have no children
         assert "CHILD2_ID" not in result or result.get("CHILD2_ID") == []
 
-    def test_identify_leaf_nodes(self, sample_standard_set):
-        """Test leaf node identification."""
-        processor = StandardSetProcessor()
-        standards_dict = {
-            std_id: std.model_dump()
-            for std_id, std in sample_standard_set.standards.items()
-        }
-
-        result = processor._identify_leaf_nodes(standards_dict)
-
+    def test_leaf_nodes_from_fused_pass(self, ready_processor):
+        """Test leaf node identification from the single-pass build."""
         # Only child2 should be a leaf (no children)
-        assert "CHILD2_ID" in result
-        assert "ROOT_ID" not in result
-        assert "CHILD1_ID" not in result
-
-    def test_identify_root_nodes(self, sample_standard_set):
-        """Test root node identification."""
-        processor = StandardSetProcessor()
-        standards_dict = {
-            std_id: std.model_dump()
-            for std_id, std in sample_standard_set.standards.items()
-        }
-
-        result = processor._identify_root_nodes(standards_dict)
+        assert ready_processor.leaf_nodes == {"CHILD2_ID"}
 
+    def test_root_nodes_from_fused_pass(self, ready_processor):
+        """Test root node identification from the single-pass build."""
         # Only ROOT_ID should be a root
-        assert "ROOT_ID" in result
-        assert "CHILD1_ID" not in result
-        assert "CHILD2_ID" not in result
+        assert ready_processor.root_nodes == {"ROOT_ID"}
 
 
 class TestHierarchyFunctions:
     """Test hierarchy functions (Task 4)."""
 
-    def test_find_root_id_for_root(self, sample_standard_set):
+    def test_find_root_id_for_root(self, ready_processor, standards_dict):
         """Test finding root ID for a root node."""
-        processor = StandardSetProcessor()
-        standards_dict = {
-            std_id: std.model_dump()
-            for std_id, std in sample_standard_set.standards.items()
-        }
-        processor.id_to_standard = processor._build_id_to_standard_map(standards_dict)
+        processor = ready_processor
 
         root_std = standards_dict["ROOT_ID"]
         root_id = processor.find_root_id(root_std, processor.id_to_standard)
 
         assert root_id == "ROOT_ID"
 
-    def test_find_root_id_for_child(self, sample_standard_set):
+    def test_find_root_id_for_child(self, ready_processor, standards_dict):
         """Test finding root ID for a child node."""
-        processor = StandardSetProcessor()
-        standards_dict = {
-            std_id: std.model_dump()
-            for std_id, std in sample_standard_set.standards.items()
-        }
-        processor.id_to_standard = processor._build_id_to_standard_map(standards_dict)
+        processor = ready_processor
 
         child_std = standards_dict["CHILD2_ID"]
         root_id = processor.find_root_id(child_std, processor.id_to_standard)
 
         assert root_id == "ROOT_ID"
 
-    def test_build_ordered_ancestors(self, sample_standard_set):
+    def test_build_ordered_ancestors(self, ready_processor, standards_dict):
         """Test building ordered ancestor list."""
-        processor = StandardSetProcessor()
-        standards_dict = {
-            std_id: std.model_dump()
-            for std_id, std in sample_standard_set.standards.items()
-        }
-        processor.id_to_standard = processor._build_id_to_standard_map(standards_dict)
+        processor = ready_processor
 
         # For root, ancestors should be empty
         root_std = standards_dict["ROOT_ID"]
@@ -208,14 +86,9 @@ class TestHierarchyFunctions:
         ancestors = processor.build_ordered_ancestors(child2_std, processor.id_to_standard)
         assert ancestors == ["ROOT_ID", "CHILD1_ID"]
 
-    def test_compute_sibling_count(self, sample_standard_set):
+    def test_compute_sibling_count(self, ready_processor, standards_dict):
         """Test sibling count computation."""
-        processor = StandardSetProcessor()
-        standards_dict = {
-            std_id: std.model_dump()
-            for std_id, std in sample_standard_set.standards.items()
-        }
-        processor.parent_to_children = processor._build_parent_to_children_map(standards_dict)
+        processor = ready_processor
 
         # Root has no siblings
         root_std = standards_dict["ROOT_ID"]
@@ -236,28 +109,18 @@ class TestHierarchyFunctions:
 class TestContentGeneration:
     """Test content text generation (Task 5)."""
 
-    def test_build_content_text_for_root(self, sample_standard_set):
+    def test_build_content_text_for_root(self, ready_processor, standards_dict):
         """Test content generation for root node."""
-        processor = StandardSetProcessor()
-        standards_dict = {
-            std_id: std.model_dump()
-            for std_id, std in sample_standard_set.standards.items()
-        }
-        processor.id_to_standard = processor._build_id_to_standard_map(standards_dict)
+        processor = ready_processor
 
         root_std = standards_dict["ROOT_ID"]
         content = processor._build_content_text(root_std)
 
         assert content == "Depth 0: Math"
 
-    def test_build_content_text_for_child(self, sample_standard_set):
+    def test_build_content_text_for_child(self, ready_processor, standards_dict):
         """Test content generation for child node with notation."""
-        processor = StandardSetProcessor()
-        standards_dict = {
-            std_id: std.model_dump()
-            for std_id, std in sample_standard_set.standards.items()
-        }
-        processor.id_to_standard = processor._build_id_to_standard_map(standards_dict)
+        processor = ready_processor
 
         child1_std = standards_dict["CHILD1_ID"]
         content = processor._build_content_text(child1_std)
@@ -265,14 +128,9 @@ class TestContentGeneration:
         expected = "Depth 0: Math\nDepth 1 (1.1): Numbers"
         assert content == expected
 
-    def test_build_content_text_for_deep_child(self, sample_standard_set):
+    def test_build_content_text_for_deep_child(self, ready_processor, standards_dict):
         """Test content generation for deep child node."""
-        processor = StandardSetProcessor()
-        standards_dict = {
-            std_id: std.model_dump()
-            for std_id, std in sample_standard_set.standards.items()
-        }
-        processor.id_to_standard = processor._build_id_to_standard_map(standards_dict)
+        processor = ready_processor
 
         child2_std = standards_dict["CHILD2_ID"]
         content = processor._build_content_text(child2_std)
@@ -395,16 +253,32 @@ class TestRecordTransformation:
         processed_set = processor.process_standard_set(sample_standard_set)
 
         assert len(processed_set.records) == 3
-        assert all(isinstance(r, type(processed_set.records[0])) for r in processed_set.records)
+        assert {type(r) for r in processed_set.records} == {PineconeRecord}
+
+
+@pytest.fixture
+def settings_dir(monkeypatch, tmp_path):
+    """
+    Point the processor at a temporary standardSets directory.
+
+    A single attribute swap replaces the patch() context managers the
+    file-operation tests used to build MagicMocks with.
+    """
+    sets_dir = tmp_path / "standardSets"
+    monkeypatch.setattr(
+        "tools.pinecone_processor.settings",
+        SimpleNamespace(standard_sets_dir=sets_dir),
+    )
+    return sets_dir
 
 
 class TestFileOperations:
     """Test file operations (Task 7)."""
 
-    def test_process_and_save(self, tmp_path, sample_standard_set):
+    def test_process_and_save(self, settings_dir, sample_standard_set):
         """Test processing and saving to file."""
         # Create temporary directory structure
-        set_dir = tmp_path / "standardSets" / "TEST_SET_ID"
+        set_dir = settings_dir / "TEST_SET_ID"
         set_dir.mkdir(parents=True)
 
         # Save sample data.json
@@ -413,39 +287,39 @@ class TestFileOperations:
         with open(data_file, "w", encoding="utf-8") as f:
             json.dump(response_data, f)
 
-        # Mock the settings to use tmp_path
-        from unittest.mock import patch
-        from tools.config import ToolsSettings
-
-        with patch("tools.pinecone_processor.settings") as mock_settings:
-            mock_settings.standard_sets_dir = tmp_path / "standardSets"
-            
-            processed_file = process_and_save("TEST_SET_ID")
+        processed_file = process_and_save("TEST_SET_ID")
 
-            assert processed_file.exists()
-            assert processed_file.name == "processed.json"
+        assert processed_file.exists()
+        assert processed_file.name == "processed.json"
 
-            # Verify content
-            with open(processed_file, encoding="utf-8") as f:
-                data = json.load(f)
+        # Verify content
+        with open(processed_file, encoding="utf-8") as f:
+            data = json.load(f)
 
-            assert "records" in data
-            assert len(data["records"]) == 3
+        assert "records" in data
+        assert len(data["records"]) == 3
 
-    def test_process_and_save_missing_file(self):
+    def test_process_and_save_missing_file(self, settings_dir):
         """Test error handling for missing data.json."""
-        from unittest.mock import patch
-        from tools.config import ToolsSettings
+        with pytest.raises(FileNotFoundError):
+            process_and_save("NONEXISTENT_SET")
 
-        with patch("tools.pinecone_processor.settings") as mock_settings:
-            mock_settings.standard_sets_dir = Path("/nonexistent/path")
+    def test_process_and_save_invalid_standard_data(self, settings_dir):
+        """Test invalid standard set data still fails validation at the boundary."""
+        set_dir = settings_dir / "TEST_SET_ID"
+        set_dir.mkdir(parents=True)
+
+        # Valid JSON, but not a valid standard set payload
+        data_file = set_dir / "data.json"
+        with open(data_file, "w", encoding="utf-8") as f:
+            json.dump({"data": {"id": "SET_ID"}}, f)
 
-            with pytest.raises(FileNotFoundError):
-                process_and_save("NONEXISTENT_SET")
+        with pytest.raises(ValueError, match="Failed to parse"):
+            process_and_save("TEST_SET_ID")
 
-    def test_process_and_save_invalid_json(self, tmp_path):
+    def test_process_and_save_invalid_json(self, settings_dir):
         """Test error handling for invalid JSON."""
-        set_dir = tmp_path / "standardSets" / "TEST_SET_ID"
+        set_dir = settings_dir / "TEST_SET_ID"
         set_dir.mkdir(parents=True)
 
         # Write invalid JSON
@@ -453,11 +327,6 @@ class TestFileOperations:
         with open(data_file, "w", encoding="utf-8") as f:
             f.write("{ invalid json }")
 
-        from unittest.mock import patch
-
-        with patch("tools.pinecone_processor.settings") as mock_settings:
-            mock_settings.standard_sets_dir = tmp_path / "standardSets"
-
-            with pytest.raises(ValueError, match="Invalid JSON"):
-                process_and_save("TEST_SET_ID")
+        with pytest.raises(ValueError, match="Invalid JSON"):
+            process_and_save("TEST_SET_ID")
 
@@ -0,0 +1,83 @@
+"""Unit tests for the search query cache."""
+
+from __future__ import annotations
+
+from src.query_cache import QueryCache
+
+
+class TestQueryCache:
+    """Tests for LRU+TTL cache behavior."""
+
+    def test_get_returns_none_on_miss(self):
+        cache = QueryCache()
+        assert cache.get("fractions", 5, None) is None
+
+    def test_put_then_get_returns_value(self):
+        cache = QueryCache()
+        cache.put("fractions", 5, None, [{"_id": "abc"}])
+        assert cache.get("fractions", 5, None) == [{"_id": "abc"}]
+
+    def test_key_normalizes_case_and_whitespace(self):
+        cache = QueryCache()
+        cache.put("Teaching  Fractions", 5, None, "value")
+        assert cache.get("teaching fractions", 5, None) == "value"
+
+    def test_key_normalizes_punctuation(self):
+        cache = QueryCache()
+        cache.put("Teaching fractions!", 5, None, "value")
+        assert cache.get("teaching, fractions", 5, None) == "value"
+
+    def test_different_top_k_or_grade_miss(self):
+        cache = QueryCache()
+        cache.put("fractions", 5, None, "value")
+        assert cache.get("fractions", 10, None) is None
+        assert cache.get("fractions", 5, "03") is None
+
+    def test_lru_eviction_drops_oldest(self):
+        cache = QueryCache(max_size=2)
+        cache.put("a", 5, None, "first")
+        cache.put("b", 5, None, "second")
+        cache.put("c", 5, None, "third")
+        assert cache.get("a", 5, None) is None
+        assert cache.get("b", 5, None) == "second"
+        assert cache.get("c", 5, None) == "third"
+
+    def test_ttl_expires_entries(self):
+        cache = QueryCache(ttl_seconds=0.0)
+        cache.put("fractions", 5, None, "value")
+        assert cache.get("fractions", 5, None) is None
+
+    def test_invalidate_clears_all_entries(self):
+        cache = QueryCache()
+        cache.put("a", 5, None, "first")
+        cache.put("b", 5, None, "second")
+        cache.invalidate()
+        assert cache.get("a", 5, None) is None
+        assert cache.get("b", 5, None) is None
+
+    def test_persisted_entries_survive_restart(self, tmp_path):
+        db_path = tmp_path / "cache.db"
+        cache = QueryCache(persist_path=db_path)
+        cache.put("fractions", 5, None, [{"_id": "abc"}])
+        cache.flush()
+
+        warmed = QueryCache(persist_path=db_path)
+        assert warmed.get("fractions", 5, None) == [{"_id": "abc"}]
+
+    def test_invalidate_clears_persisted_entries(self, tmp_path):
+        db_path = tmp_path / "cache.db"
+        cache = QueryCache(persist_path=db_path)
+        cache.put("fractions", 5, None, "value")
+        cache.invalidate()
+        cache.flush()
+
+        warmed = QueryCache(persist_path=db_path)
+        assert warmed.get("fractions", 5, None) is None
+
+    def test_stats_counts_hits_and_misses(self):
+        cache = QueryCache()
+        cache.put("a", 5, None, "value")
+        cache.get("a", 5, None)
+        cache.get("b", 5, None)
+        stats = cache.stats()
+        assert stats == {"hits": 1, "misses": 1, "size": 1}
@@ -2,17 +2,32 @@
 
 from __future__ import annotations
 
-import json
+import hashlib
+import os
+import random
+import threading
 import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
+import orjson
 import requests
 from loguru import logger
+from pydantic import ValidationError
+from requests.adapters import HTTPAdapter
 
 from tools.config import get_settings
 from tools.models import (
+    Document,
     Jurisdiction,
     JurisdictionDetails,
+    JurisdictionRef,
+    License,
+    Standard,
     StandardSet,
     StandardSetReference,
 )
@@ -24,7 +39,30 @@ JURISDICTIONS_CACHE_FILE = settings.raw_data_dir / "jurisdictions.json"
 
 # Rate limiting: Max requests per minute
 MAX_REQUESTS_PER_MINUTE = settings.max_requests_per_minute
-_request_timestamps: list[float] = []
+_REQUESTS_PER_SECOND = MAX_REQUESTS_PER_MINUTE / 60.0
+
+# Token-bucket state: tokens refill continuously at the per-second rate up
+# to a burst capacity of one minute's worth of requests
+_bucket_tokens: float = float(MAX_REQUESTS_PER_MINUTE)
+_bucket_last: float = time.monotonic()
+_rate_lock = threading.Lock()
+
+# Concurrent standard-set downloads; pool_maxsize below must cover this
+_DOWNLOAD_WORKERS = 8
+
+# Retry backoff bounds (seconds) for decorrelated jitter
+_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 30.0
+
+# Shared session so repeated requests reuse TCP+TLS connections instead of
+# paying a fresh handshake per call
+_session: requests.Session | None = None
+_session_api_key: str | None = None
+
+# In-flight standard-set downloads, keyed by set id, so concurrent callers
+# coalesce onto one HTTP fetch instead of racing on the cache file
+_inflight: dict[str, threading.Event] = {}
+_inflight_lock = threading.Lock()
 
 
 class APIError(Exception):
@@ -41,27 +79,151 @@ def _get_headers() -> dict[str, str]:
     return {"Api-Key": settings.csp_api_key}
 
 
+def _get_session() -> requests.Session:
+    """
+    Get the shared HTTP session, creating it on first use.
+
+    The session carries the auth header and a pooled adapter; it is rebuilt
+    if the API key changes (e.g., reconfigured between calls in tests).
+    """
+    global _session, _session_api_key
+    if _session is None or _session_api_key != settings.csp_api_key:
+        session = requests.Session()
+        session.headers.update(_get_headers())
+        # Size the per-host pool to comfortably cover the parallel
+        # download fan-out so no worker waits for a free connection
+        session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=max(20, _DOWNLOAD_WORKERS * 2),
+                max_retries=0,
+            ),
+        )
+        _session = session
+        _session_api_key = settings.csp_api_key
+    return _session
+
+
 def _enforce_rate_limit() -> None:
-    """Enforce rate limiting by tracking request timestamps."""
-    global _request_timestamps
-    now = time.time()
+    """
+    Enforce rate limiting with a token bucket.
+
+    Tokens refill continuously at MAX_REQUESTS_PER_MINUTE / 60 per second
+    (capped at one minute's worth), and each request consumes one. This is
+    O(1) per call and spreads traffic evenly instead of bursting at
+    minute-window boundaries. Bucket state is lock-guarded so concurrent
+    downloaders can share the limiter; the lock is dropped while sleeping
+    so waiters don't serialize behind each other.
+    """
+    global _bucket_tokens, _bucket_last
+
+    while True:
+        with _rate_lock:
+            now = time.monotonic()
+            _bucket_tokens = min(
+                float(MAX_REQUESTS_PER_MINUTE),
+                _bucket_tokens + (now - _bucket_last) * _REQUESTS_PER_SECOND,
+            )
+            _bucket_last = now
+
+            if _bucket_tokens >= 1.0:
+                _bucket_tokens -= 1.0
+                return
 
-    # Remove timestamps older than 1 minute
-    _request_timestamps = [ts for ts in _request_timestamps if now - ts < 60]
+            sleep_time = (1.0 - _bucket_tokens) / _REQUESTS_PER_SECOND
 
-    # If at limit, wait
-    if len(_request_timestamps) >= MAX_REQUESTS_PER_MINUTE:
-        sleep_time = 60 - (now - _request_timestamps[0])
         logger.warning(f"Rate limit reached. Waiting {sleep_time:.1f} seconds...")
         time.sleep(sleep_time)
-        _request_timestamps = []
 
-    _request_timestamps.append(now)
+
+def _next_backoff(prev_sleep: float) -> float:
+    """
+    Decorrelated-jitter backoff (AWS style): uniform over [base, prev * 3].
+
+    Randomizing the wait keeps concurrent retriers from waking in sync and
+    hammering the server together the way a deterministic 2**attempt does.
+    """
+    return random.uniform(_BACKOFF_BASE, min(_BACKOFF_CAP, prev_sleep * 3))
+
+
+@lru_cache(maxsize=4096)
+def _jurisdiction_cache_path(jurisdiction_id: str) -> Path:
+    """Cache-file path for a jurisdiction's metadata, built once per id."""
+    return settings.raw_data_dir / "jurisdictions" / jurisdiction_id / "data.json"
+
+
+@lru_cache(maxsize=4096)
+def _std_set_cache_path(set_id: str) -> Path:
+    """Cache-file path for a standard set, built once per id."""
+    return settings.raw_data_dir / "standardSets" / set_id / "data.json"
+
+
+def _unchanged(path_a: Path, path_b: Path) -> bool:
+    """Compare two files' contents by BLAKE2s digest."""
+    try:
+        return (
+            hashlib.blake2s(path_a.read_bytes()).digest()
+            == hashlib.blake2s(path_b.read_bytes()).digest()
+        )
+    except IOError:
+        return False
+
+
+def _write_cache_atomic(cache_file: Path, new_bytes: bytes) -> None:
+    """
+    Write cache bytes via a temp file and os.replace.
+
+    A crash mid-write can no longer leave a truncated JSON behind, and the
+    write is skipped entirely when the content is unchanged.
+    """
+    if cache_file.exists():
+        try:
+            if (
+                hashlib.blake2s(new_bytes).digest()
+                == hashlib.blake2s(cache_file.read_bytes()).digest()
+            ):
+                return
+        except IOError:
+            pass
+    tmp_path = cache_file.with_suffix(".tmp")
+    tmp_path.write_bytes(new_bytes)
+    os.replace(tmp_path, cache_file)
+
+
+def _discard_cache(cache_file: Path) -> None:
+    """
+    Drop a cache file and its .etag sidecar.
+
+    Used when a freshly streamed payload fails validation: the bytes were
+    committed to disk before the model check ran, so they must not survive
+    to be trusted by later warm reads.
+    """
+    for path in (cache_file, cache_file.with_suffix(".etag")):
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def _conditional_headers(cache_file: Path) -> dict[str, str] | None:
+    """Build If-None-Match headers from a cache file's .etag sidecar."""
+    etag_file = cache_file.with_suffix(".etag")
+    if cache_file.exists() and etag_file.exists():
+        try:
+            return {"If-None-Match": etag_file.read_text().strip()}
+        except IOError:
+            pass
+    return None
 
 
 def _make_request(
-    endpoint: str, params: dict[str, Any] | None = None, max_retries: int = 3
-) -> dict[str, Any]:
+    endpoint: str,
+    params: dict[str, Any] | None = None,
+    max_retries: int = 3,
+    stream_to: Path | None = None,
+    extra_headers: dict[str, str] | None = None,
+) -> dict[str, Any] | None:
     """
     Make API request with exponential backoff retry logic.
 
@@ -69,15 +231,25 @@ def _make_request(
         endpoint: API endpoint path (e.g., "/jurisdictions")
         params: Query parameters
         max_retries: Maximum number of retry attempts
+        stream_to: If set, stream the raw body to this file (written
+            atomically via a temp file) and parse from disk instead of
+            buffering and re-serializing the payload in memory. An ETag
+            response header is saved to a .etag sidecar next to the file.
+        extra_headers: Per-request headers merged over the session headers
+            (e.g., If-None-Match for conditional GETs)
 
     Returns:
-        Parsed JSON response
+        Parsed JSON response, or None when the server answers 304 Not
+        Modified to a conditional request
 
     Raises:
         APIError: After all retries exhausted or on fatal errors
     """
+    # All rate-limit accounting lives here, below the callers' cache
+    # checks, so cache hits never consume tokens or touch the session
     url = f"{settings.csp_base_url}{endpoint}"
-    headers = _get_headers()
+    session = _get_session()
+    prev_sleep = _BACKOFF_BASE
 
     for attempt in range(max_retries):
         try:
@@ -86,7 +258,13 @@ def _make_request(
             logger.debug(
                 f"API request: {endpoint} (attempt {attempt + 1}/{max_retries})"
             )
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = session.get(
+                url,
+                params=params,
+                timeout=30,
+                stream=stream_to is not None,
+                headers=extra_headers,
+            )
 
             # Handle specific status codes
             if response.status_code == 401:
@@ -106,21 +284,45 @@ def _make_request(
                 time.sleep(retry_after)
                 continue
 
+            if response.status_code == 304:
+                # Conditional GET: upstream unchanged, caller keeps its cache
+                logger.info(f"Not modified (304): {endpoint}")
+                return None
+
             response.raise_for_status()
             logger.info(f"API request successful: {endpoint}")
-            return response.json()
+            if stream_to is not None:
+                tmp_path = stream_to.with_suffix(".tmp")
+                with open(tmp_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        f.write(chunk)
+                if stream_to.exists() and _unchanged(tmp_path, stream_to):
+                    # Same bytes as the cached copy: drop the temp file and
+                    # keep the existing file's metadata/blocks untouched
+                    os.remove(tmp_path)
+                else:
+                    os.replace(tmp_path, stream_to)
+                etag = response.headers.get("ETag")
+                if etag:
+                    stream_to.with_suffix(".etag").write_text(etag)
+                with open(stream_to, "rb") as f:
+                    return orjson.loads(f.read())
+            # orjson takes the raw bytes directly, skipping requests'
+            # charset detection and the stdlib parser (CSP always
+            # returns UTF-8 JSON)
+            return orjson.loads(response.content)
 
         except requests.exceptions.Timeout:
-            wait_time = 2**attempt  # Exponential backoff: 1s, 2s, 4s
-            logger.warning(f"Request timeout. Retrying in {wait_time}s...")
+            wait_time = prev_sleep = _next_backoff(prev_sleep)
+            logger.warning(f"Request timeout. Retrying in {wait_time:.1f}s...")
             if attempt < max_retries - 1:
                 time.sleep(wait_time)
             else:
                 raise APIError(f"Request timeout after {max_retries} attempts")
 
         except requests.exceptions.ConnectionError:
-            wait_time = 2**attempt
-            logger.warning(f"Connection error. Retrying in {wait_time}s...")
+            wait_time = prev_sleep = _next_backoff(prev_sleep)
+            logger.warning(f"Connection error. Retrying in {wait_time:.1f}s...")
             if attempt < max_retries - 1:
                 time.sleep(wait_time)
             else:
@@ -130,10 +332,16 @@ def _make_request(
             # Don't retry on 4xx errors (except 429)
             if 400 <= response.status_code < 500 and response.status_code != 429:
                 raise APIError(f"HTTP {response.status_code}: {response.text}")
-            # Retry on 5xx errors
-            wait_time = 2**attempt
+            # Retry on 5xx errors, honoring Retry-After when the server
+            # provides one before falling back to jittered backoff. The
+            # header may be an HTTP-date rather than seconds, in which
+            # case the parse fails and jitter takes over
+            try:
+                wait_time = float(response.headers["Retry-After"])
+            except (KeyError, TypeError, ValueError):
+                wait_time = prev_sleep = _next_backoff(prev_sleep)
             logger.warning(
-                f"Server error {response.status_code}. Retrying in {wait_time}s..."
+                f"Server error {response.status_code}. Retrying in {wait_time:.1f}s..."
             )
             if attempt < max_retries - 1:
                 time.sleep(wait_time)
@@ -143,38 +351,21 @@ def _make_request(
     raise APIError("Request failed after all retries")
 
 
-def get_jurisdictions(
-    search_term: str | None = None,
-    type_filter: str | None = None,
-    force_refresh: bool = False,
-) -> list[Jurisdiction]:
-    """
-    Fetch all jurisdictions from the API or local cache.
-
-    Jurisdictions are cached locally in data/raw/jurisdictions.json to avoid
-    repeated API calls. Use force_refresh=True to fetch fresh data from the API.
-
-    Args:
-        search_term: Optional filter for jurisdiction title (case-insensitive partial match)
-        type_filter: Optional filter for jurisdiction type (case-insensitive).
-                     Valid values: "school", "organization", "state", "nation"
-        force_refresh: If True, fetch fresh data from API and update cache
-
-    Returns:
-        List of Jurisdiction models
-    """
-    jurisdictions: list[Jurisdiction] = []
+def _load_jurisdictions(force_refresh: bool = False) -> list[Jurisdiction]:
+    """Load and parse the full jurisdiction list from disk cache or the API."""
     raw_data: list[dict[str, Any]] = []
+    from_cache = False
 
     # Check cache first (unless forcing refresh)
     if not force_refresh and JURISDICTIONS_CACHE_FILE.exists():
         try:
             logger.info("Loading jurisdictions from cache")
-            with open(JURISDICTIONS_CACHE_FILE, encoding="utf-8") as f:
-                cached_response = json.load(f)
+            with open(JURISDICTIONS_CACHE_FILE, "rb") as f:
+                cached_response = orjson.loads(f.read())
             raw_data = cached_response.get("data", [])
+            from_cache = True
             logger.info(f"Loaded {len(raw_data)} jurisdictions from cache")
-        except (json.JSONDecodeError, IOError) as e:
+        except (orjson.JSONDecodeError, IOError) as e:
             logger.warning(f"Failed to load cache: {e}. Fetching from API...")
             force_refresh = True
 
@@ -187,92 +378,234 @@ def get_jurisdictions(
         # Save to cache
         try:
             settings.raw_data_dir.mkdir(parents=True, exist_ok=True)
-            with open(JURISDICTIONS_CACHE_FILE, "w", encoding="utf-8") as f:
-                json.dump(response, f, indent=2, ensure_ascii=False)
+            _write_cache_atomic(JURISDICTIONS_CACHE_FILE, orjson.dumps(response))
             logger.info(
                 f"Cached {len(raw_data)} jurisdictions to {JURISDICTIONS_CACHE_FILE}"
             )
         except IOError as e:
             logger.warning(f"Failed to save cache: {e}")
+        from_cache = False
 
-    # Parse into Pydantic models
-    jurisdictions = [Jurisdiction(**j) for j in raw_data]
+    # Cached entries were validated when first fetched, so cold starts
+    # skip per-entry validation; fresh API data still gets the full
+    # validating constructor
+    if from_cache:
+        return [Jurisdiction.model_construct(**j) for j in raw_data]
+    return [Jurisdiction(**j) for j in raw_data]
 
-    # Apply type filter if provided (case-insensitive)
-    if type_filter:
-        type_lower = type_filter.lower()
-        original_count = len(jurisdictions)
-        jurisdictions = [j for j in jurisdictions if j.type.lower() == type_lower]
-        logger.info(
-            f"Filtered to {len(jurisdictions)} jurisdictions of type '{type_filter}' (from {original_count})"
-        )
 
-    # Apply search filter if provided (case-insensitive partial match)
-    if search_term:
-        search_lower = search_term.lower()
-        original_count = len(jurisdictions)
-        jurisdictions = [j for j in jurisdictions if search_lower in j.title.lower()]
-        logger.info(
-            f"Filtered to {len(jurisdictions)} jurisdictions matching '{search_term}' (from {original_count})"
-        )
+@lru_cache(maxsize=1)
+def _load_jurisdictions_cached() -> tuple[tuple[Jurisdiction, str, str], ...]:
+    """
+    In-process memo of the parsed jurisdiction list for warm-path reads.
 
-    return jurisdictions
+    Each entry carries pre-lowered title and type so repeat filtered calls
+    skip the per-jurisdiction str.lower() work.
+    """
+    return tuple(
+        (j, j.title.lower(), j.type.lower()) for j in _load_jurisdictions()
+    )
 
 
-def get_jurisdiction_details(
-    jurisdiction_id: str, force_refresh: bool = False, hide_hidden_sets: bool = True
-) -> JurisdictionDetails:
+def get_jurisdictions(
+    search_term: str | None = None,
+    type_filter: str | None = None,
+    force_refresh: bool = False,
+) -> list[Jurisdiction]:
     """
-    Fetch jurisdiction metadata including standard set references.
-
-    Jurisdiction metadata is cached locally in data/raw/jurisdictions/{jurisdiction_id}/data.json
-    to avoid repeated API calls. Use force_refresh=True to fetch fresh data from the API.
+    Fetch all jurisdictions from the API or local cache.
 
-    Note: This returns metadata about standard sets (IDs, titles, subjects) but NOT the
-    full standard set content. Use download_standard_set() to get full standard set data.
+    Jurisdictions are cached locally in data/raw/jurisdictions.json and
+    memoized in-process, so repeated calls within a session skip the disk
+    read and re-validation. Use force_refresh=True to fetch fresh data
+    from the API.
 
     Args:
-        jurisdiction_id: The jurisdiction GUID
+        search_term: Optional filter for jurisdiction title (case-insensitive partial match)
+        type_filter: Optional filter for jurisdiction type (case-insensitive).
+                     Valid values: "school", "organization", "state", "nation"
         force_refresh: If True, fetch fresh data from API and update cache
-        hide_hidden_sets: If True, hide deprecated/outdated sets (default: True)
 
     Returns:
-        JurisdictionDetails model with jurisdiction metadata and standardSets array
+        List of Jurisdiction models
     """
-    cache_dir = settings.raw_data_dir / "jurisdictions" / jurisdiction_id
-    cache_file = cache_dir / "data.json"
+    if force_refresh:
+        _load_jurisdictions_cached.cache_clear()
+        entries = [
+            (j, j.title.lower(), j.type.lower())
+            for j in _load_jurisdictions(force_refresh=True)
+        ]
+    else:
+        entries = _load_jurisdictions_cached()
+
+    # Apply both filters (case-insensitive) in one pass over the
+    # pre-lowered strings
+    type_lower = type_filter.lower() if type_filter else None
+    search_lower = search_term.lower() if search_term else None
+
+    jurisdictions = [
+        j
+        for j, title_lc, type_lc in entries
+        if (type_lower is None or type_lc == type_lower)
+        and (search_lower is None or search_lower in title_lc)
+    ]
+
+    if type_lower is not None or search_lower is not None:
+        logger.info(
+            f"Filtered to {len(jurisdictions)} jurisdictions "
+            f"(type={type_filter!r}, search={search_term!r}, from {len(entries)})"
+        )
+
+    return jurisdictions
+
+
+def _construct_jurisdiction_details(raw_data: dict[str, Any]) -> JurisdictionDetails:
+    """
+    Build JurisdictionDetails from trusted cache data without validation.
+
+    model_construct is not recursive, so the nested references are
+    constructed explicitly to keep the model shapes identical to a
+    validated build. A payload that doesn't have the expected shape
+    (e.g., a cache written by an older build) falls back to the
+    validating constructor so callers see a ValidationError instead of
+    a bare KeyError or a silently malformed model.
+    """
+    data = dict(raw_data)
+    try:
+        data["standardSets"] = [
+            StandardSetReference.model_construct(
+                **{**s, "document": Document.model_construct(**s["document"])}
+            )
+            for s in data.get("standardSets", [])
+        ]
+    except (KeyError, TypeError, AttributeError):
+        return JurisdictionDetails(**raw_data)
+    return JurisdictionDetails.model_construct(**data)
+
+
+def _construct_standard_set(raw_data: dict[str, Any]) -> StandardSet:
+    """
+    Build StandardSet from trusted cache data without validation.
+
+    Like _construct_jurisdiction_details, nested models are constructed
+    explicitly since model_construct does not recurse, and payloads that
+    don't have the expected shape fall back to the validating
+    constructor rather than raising a bare KeyError.
+    """
+    data = dict(raw_data)
+    try:
+        data["license"] = License.model_construct(**data["license"])
+        data["document"] = Document.model_construct(**data["document"])
+        data["jurisdiction"] = JurisdictionRef.model_construct(**data["jurisdiction"])
+        data["standards"] = {
+            std_id: Standard.model_construct(**std)
+            for std_id, std in data.get("standards", {}).items()
+        }
+    except (KeyError, TypeError, AttributeError):
+        return StandardSet(**raw_data)
+    return StandardSet.model_construct(**data)
+
+
+def _load_jurisdiction_details(
+    jurisdiction_id: str, force_refresh: bool = False, hide_hidden_sets: bool = True
+) -> JurisdictionDetails:
+    """Load and parse one jurisdiction's metadata from disk cache or the API."""
+    cache_file = _jurisdiction_cache_path(jurisdiction_id)
+    cache_dir = cache_file.parent
     raw_data: dict[str, Any] = {}
 
     # Check cache first (unless forcing refresh)
     if not force_refresh and cache_file.exists():
         try:
             logger.info(f"Loading jurisdiction {jurisdiction_id} from cache")
-            with open(cache_file, encoding="utf-8") as f:
-                cached_response = json.load(f)
+            with open(cache_file, "rb") as f:
+                cached_response = orjson.loads(f.read())
             raw_data = cached_response.get("data", {})
             logger.info(f"Loaded jurisdiction metadata from cache")
-        except (json.JSONDecodeError, IOError) as e:
+        except (orjson.JSONDecodeError, IOError) as e:
             logger.warning(f"Failed to load cache: {e}. Fetching from API...")
             force_refresh = True
 
-    # Fetch from API if cache doesn't exist or force_refresh is True
+    # Fetch from API if cache doesn't exist or force_refresh is True,
+    # streaming straight to the cache file and sending a conditional GET
+    # when an ETag from a previous fetch is available
+    fresh = False
     if force_refresh or not raw_data:
         logger.info(f"Fetching jurisdiction {jurisdiction_id} from API")
         params = {"hideHiddenSets": "true" if hide_hidden_sets else "false"}
-        response = _make_request(f"/jurisdictions/{jurisdiction_id}", params=params)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        response = _make_request(
+            f"/jurisdictions/{jurisdiction_id}",
+            params=params,
+            stream_to=cache_file,
+            extra_headers=_conditional_headers(cache_file),
+        )
+        if response is None:
+            logger.info(
+                f"Jurisdiction {jurisdiction_id} unchanged upstream; reusing cache"
+            )
+            with open(cache_file, "rb") as f:
+                response = orjson.loads(f.read())
+        else:
+            fresh = True
+            logger.info(f"Cached jurisdiction metadata to {cache_file}")
         raw_data = response.get("data", {})
 
-        # Save to cache
+    # Validate fresh API data; cached copies were validated when first
+    # fetched, so warm reads skip straight to construction. The streamed
+    # bytes hit disk before validation runs, so a failed check must also
+    # discard the cache file or later warm reads would trust bad data
+    if fresh:
         try:
-            cache_dir.mkdir(parents=True, exist_ok=True)
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(response, f, indent=2, ensure_ascii=False)
-            logger.info(f"Cached jurisdiction metadata to {cache_file}")
-        except IOError as e:
-            logger.warning(f"Failed to save cache: {e}")
+            return JurisdictionDetails(**raw_data)
+        except ValidationError:
+            _discard_cache(cache_file)
+            raise
+    return _construct_jurisdiction_details(raw_data)
+
+
+@lru_cache(maxsize=128)
+def _load_jurisdiction_details_cached(
+    jurisdiction_id: str, hide_hidden_sets: bool
+) -> JurisdictionDetails:
+    """In-process memo of parsed jurisdiction metadata, keyed per jurisdiction."""
+    return _load_jurisdiction_details(
+        jurisdiction_id, hide_hidden_sets=hide_hidden_sets
+    )
+
+
+def get_jurisdiction_details(
+    jurisdiction_id: str, force_refresh: bool = False, hide_hidden_sets: bool = True
+) -> JurisdictionDetails:
+    """
+    Fetch jurisdiction metadata including standard set references.
+
+    Jurisdiction metadata is cached locally in data/raw/jurisdictions/{jurisdiction_id}/data.json
+    and memoized in-process, so repeated calls within a session skip the
+    disk read and re-validation. Use force_refresh=True to fetch fresh data
+    from the API.
+
+    Note: This returns metadata about standard sets (IDs, titles, subjects) but NOT the
+    full standard set content. Use download_standard_set() to get full standard set data.
+
+    Args:
+        jurisdiction_id: The jurisdiction GUID
+        force_refresh: If True, fetch fresh data from API and update cache
+        hide_hidden_sets: If True, hide deprecated/outdated sets (default: True)
 
-    # Parse into Pydantic model
-    return JurisdictionDetails(**raw_data)
+    Returns:
+        JurisdictionDetails model with jurisdiction metadata and standardSets array
+    """
+    if force_refresh:
+        details = _load_jurisdiction_details(
+            jurisdiction_id, force_refresh=True, hide_hidden_sets=hide_hidden_sets
+        )
+        # Drop memoized entries so later warm calls re-read the fresh cache
+        _load_jurisdiction_details_cached.cache_clear()
+        _jurisdiction_set_indexes.cache_clear()
+        return details
+
+    return _load_jurisdiction_details_cached(jurisdiction_id, hide_hidden_sets)
 
 
 def download_standard_set(set_id: str, force_refresh: bool = False) -> StandardSet:
@@ -289,97 +622,207 @@ def download_standard_set(set_id: str, force_refresh: bool = False) -> StandardS
     Returns:
         StandardSet model with complete standard set data including hierarchy
     """
-    cache_dir = settings.raw_data_dir / "standardSets" / set_id
-    cache_file = cache_dir / "data.json"
+    cache_file = _std_set_cache_path(set_id)
+    cache_dir = cache_file.parent
     raw_data: dict[str, Any] = {}
 
     # Check cache first (unless forcing refresh)
     if not force_refresh and cache_file.exists():
         try:
             logger.info(f"Loading standard set {set_id} from cache")
-            with open(cache_file, encoding="utf-8") as f:
-                cached_response = json.load(f)
+            with open(cache_file, "rb") as f:
+                cached_response = orjson.loads(f.read())
             raw_data = cached_response.get("data", {})
             logger.info(f"Loaded standard set from cache")
-        except (json.JSONDecodeError, IOError) as e:
+        except (orjson.JSONDecodeError, IOError) as e:
             logger.warning(f"Failed to load cache: {e}. Fetching from API...")
             force_refresh = True
 
-    # Fetch from API if cache doesn't exist or force_refresh is True
+    # Fetch from API if cache doesn't exist or force_refresh is True.
+    # Stream the (potentially large) body straight into the cache file so
+    # the payload is never re-serialized in memory. If a previous download
+    # left an ETag, send a conditional GET so an unchanged set costs only
+    # headers.
+    fresh = False
     if force_refresh or not raw_data:
-        logger.info(f"Downloading standard set {set_id} from API")
-        response = _make_request(f"/standard_sets/{set_id}")
-        raw_data = response.get("data", {})
+        # Coalesce concurrent downloads of the same set: the first caller
+        # fetches while the rest wait and read the refreshed cache
+        while True:
+            with _inflight_lock:
+                event = _inflight.get(set_id)
+                if event is None:
+                    _inflight[set_id] = threading.Event()
+                    break
+            event.wait()
+            try:
+                with open(cache_file, "rb") as f:
+                    raw_data = orjson.loads(f.read()).get("data", {})
+            except (orjson.JSONDecodeError, IOError):
+                raw_data = {}
+            if raw_data:
+                logger.info(
+                    f"Standard set {set_id} fetched by a concurrent caller; "
+                    "reusing cache"
+                )
+                return _construct_standard_set(raw_data)
+            # The downloader failed; loop around and take over the fetch
 
-        # Save to cache
         try:
+            logger.info(f"Downloading standard set {set_id} from API")
             cache_dir.mkdir(parents=True, exist_ok=True)
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(response, f, indent=2, ensure_ascii=False)
-            logger.info(f"Cached standard set to {cache_file}")
-        except IOError as e:
-            logger.warning(f"Failed to save cache: {e}")
-
-    # Parse into Pydantic model
-    return StandardSet(**raw_data)
+            response = _make_request(
+                f"/standard_sets/{set_id}",
+                stream_to=cache_file,
+                extra_headers=_conditional_headers(cache_file),
+            )
+            if response is None:
+                logger.info(
+                    f"Standard set {set_id} unchanged upstream; reusing cache"
+                )
+                with open(cache_file, "rb") as f:
+                    response = orjson.loads(f.read())
+            else:
+                fresh = True
+                logger.info(f"Cached standard set to {cache_file}")
+            raw_data = response.get("data", {})
+        finally:
+            with _inflight_lock:
+                _inflight.pop(set_id).set()
+
+    # Validate fresh API data; cached copies were validated when first
+    # fetched, so warm reads skip straight to construction. The streamed
+    # bytes hit disk before validation runs, so a failed check must also
+    # discard the cache file or later warm reads would trust bad data
+    if fresh:
+        try:
+            return StandardSet(**raw_data)
+        except ValidationError:
+            _discard_cache(cache_file)
+            raise
+    return _construct_standard_set(raw_data)
+
+
+@dataclass(frozen=True, slots=True)
+class _FilterSpec:
+    """Filter inputs normalized once, shared across all candidate checks."""
+
+    education_levels_upper: frozenset[str] | None = None
+    publication_status_lc: str | None = None
+    valid_year: str | None = None
+    title_search_lc: str | None = None
+    subject_search_lc: str | None = None
+
+    @classmethod
+    def build(
+        cls,
+        education_levels: list[str] | None = None,
+        publication_status: str | None = None,
+        valid_year: str | None = None,
+        title_search: str | None = None,
+        subject_search: str | None = None,
+    ) -> _FilterSpec:
+        """Normalize raw filter strings into a reusable spec."""
+        return cls(
+            education_levels_upper=(
+                frozenset(level.upper() for level in education_levels)
+                if education_levels
+                else None
+            ),
+            publication_status_lc=(
+                publication_status.lower() if publication_status else None
+            ),
+            valid_year=valid_year or None,
+            title_search_lc=title_search.lower() if title_search else None,
+            subject_search_lc=subject_search.lower() if subject_search else None,
+        )
 
 
 def _filter_standard_set(
-    standard_set: StandardSetReference,
-    education_levels: list[str] | None = None,
-    publication_status: str | None = None,
-    valid_year: str | None = None,
-    title_search: str | None = None,
-    subject_search: str | None = None,
+    standard_set: StandardSetReference, spec: _FilterSpec
 ) -> bool:
     """
-    Check if a standard set matches all provided filters (AND logic).
+    Check if a standard set matches all filters in the spec (AND logic).
 
     Args:
         standard_set: StandardSetReference model from jurisdiction metadata
-        education_levels: List of grade levels to match (any match)
-        publication_status: Publication status to match
-        valid_year: Valid year string to match
-        title_search: Partial string match on title (case-insensitive)
-        subject_search: Partial string match on subject (case-insensitive)
+        spec: Pre-normalized filter values
 
     Returns:
         True if standard set matches all provided filters
     """
-    # Filter by education levels (any match)
-    if education_levels:
-        set_levels = {level.upper() for level in standard_set.educationLevels}
-        filter_levels = {level.upper() for level in education_levels}
-        if not set_levels.intersection(filter_levels):
+    # Predicates run cheapest-first so most rejects return after one or
+    # two comparisons: exact matches, then the set intersection, then the
+    # substring scans. Both sides of every comparison are pre-normalized.
+
+    # Filter by valid year
+    if spec.valid_year:
+        if standard_set.document.valid != spec.valid_year:
             return False
 
     # Filter by publication status
-    if publication_status:
-        if (
-            standard_set.document.publicationStatus
-            and standard_set.document.publicationStatus.lower()
-            != publication_status.lower()
-        ):
+    if spec.publication_status_lc:
+        status_lc = standard_set.publication_status_lc
+        if status_lc is not None and status_lc != spec.publication_status_lc:
             return False
 
-    # Filter by valid year
-    if valid_year:
-        if standard_set.document.valid != valid_year:
+    # Filter by education levels (any match)
+    if spec.education_levels_upper:
+        if standard_set.education_levels_upper.isdisjoint(
+            spec.education_levels_upper
+        ):
             return False
 
     # Filter by title search (partial match, case-insensitive)
-    if title_search:
-        if title_search.lower() not in standard_set.title.lower():
+    if spec.title_search_lc:
+        if spec.title_search_lc not in standard_set.title_lc:
             return False
 
     # Filter by subject search (partial match, case-insensitive)
-    if subject_search:
-        if subject_search.lower() not in standard_set.subject.lower():
+    if spec.subject_search_lc:
+        if spec.subject_search_lc not in standard_set.subject_lc:
             return False
 
     return True
 
 
+@lru_cache(maxsize=128)
+def _jurisdiction_set_indexes(
+    jurisdiction_id: str, hide_hidden_sets: bool = True
+) -> dict[str, Any]:
+    """
+    Equality indexes over a jurisdiction's standard sets, built once per id.
+
+    Maps normalized publication status, valid year, and education level to
+    the indices of matching sets so the batch-download filter can intersect
+    small candidate groups instead of evaluating every set. Sets without a
+    publication status are tracked separately because the filter lets them
+    pass any status value.
+    """
+    details = _load_jurisdiction_details_cached(jurisdiction_id, hide_hidden_sets)
+
+    by_status: dict[str, set[int]] = defaultdict(set)
+    status_missing: set[int] = set()
+    by_valid: dict[str, set[int]] = defaultdict(set)
+    by_level: dict[str, set[int]] = defaultdict(set)
+
+    for i, ref in enumerate(details.standardSets):
+        if ref.document.publicationStatus:
+            by_status[ref.document.publicationStatus.lower()].add(i)
+        else:
+            status_missing.add(i)
+        if ref.document.valid:
+            by_valid[ref.document.valid].add(i)
+        for level in ref.educationLevels:
+            by_level[level.upper()].add(i)
+
+    return {
+        "status": by_status,
+        "status_missing": status_missing,
+        "valid": by_valid,
+        "level": by_level,
+    }
+
+
 def download_standard_sets_by_jurisdiction(
     jurisdiction_id: str,
     force_refresh: bool = False,
@@ -408,28 +851,56 @@ def download_standard_sets_by_jurisdiction(
     jurisdiction_data = get_jurisdiction_details(jurisdiction_id, force_refresh=False)
     standard_sets = jurisdiction_data.standardSets
 
-    # Apply filters
-    filtered_sets = [
-        s
-        for s in standard_sets
-        if _filter_standard_set(
-            s,
-            education_levels=education_levels,
-            publication_status=publication_status,
-            valid_year=valid_year,
-            title_search=title_search,
-            subject_search=subject_search,
-        )
-    ]
-
-    # Download each filtered standard set
+    # Narrow candidates through the prebuilt equality indexes before
+    # running the full per-set predicate, which still covers the substring
+    # filters and keeps AND-correctness
+    indices: set[int] | None = None
+    if education_levels or publication_status or valid_year:
+        indexes = _jurisdiction_set_indexes(jurisdiction_id)
+        if publication_status:
+            indices = (
+                indexes["status"].get(publication_status.lower(), set())
+                | indexes["status_missing"]
+            )
+        if valid_year:
+            hits = indexes["valid"].get(valid_year, set())
+            indices = hits if indices is None else indices & hits
+        if education_levels:
+            hits: set[int] = set()
+            for level in education_levels:
+                hits |= indexes["level"].get(level.upper(), set())
+            indices = hits if indices is None else indices & hits
+
+    candidates = (
+        standard_sets
+        if indices is None
+        else [standard_sets[i] for i in sorted(indices)]
+    )
+
+    # Apply filters, normalizing the inputs once for all candidates
+    spec = _FilterSpec.build(
+        education_levels=education_levels,
+        publication_status=publication_status,
+        valid_year=valid_year,
+        title_search=title_search,
+        subject_search=subject_search,
+    )
+    filtered_sets = [s for s in candidates if _filter_standard_set(s, spec)]
+
+    # Download filtered sets in parallel: the work is I/O-bound and both the
+    # shared session and the token-bucket limiter are thread-safe
     downloaded_ids = []
-    for standard_set in filtered_sets:
-        set_id = standard_set.id
-        try:
-            download_standard_set(set_id, force_refresh=force_refresh)
-            downloaded_ids.append(set_id)
-        except Exception as e:
-            logger.error(f"Failed to download standard set {set_id}: {e}")
+    with ThreadPoolExecutor(max_workers=_DOWNLOAD_WORKERS) as executor:
+        futures = {
+            executor.submit(download_standard_set, s.id, force_refresh): s.id
+            for s in filtered_sets
+        }
+        for future in as_completed(futures):
+            set_id = futures[future]
+            try:
+                future.result()
+                downloaded_ids.append(set_id)
+            except Exception as e:
+                logger.error(f"Failed to download standard set {set_id}: {e}")
 
     return downloaded_ids
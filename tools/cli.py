@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import os
+import re
 import sys
 from pathlib import Path
 
@@ -14,29 +16,196 @@ import typer
 from loguru import logger
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
 
-from tools import api_client, data_manager
-from tools.config import get_settings
-from tools.pinecone_processor import process_and_save
+# Heavy modules (api_client, data_manager, pinecone_processor, settings) are
+# imported inside the commands that need them so short-lived invocations
+# like --help don't pay for the full import graph.
 
-settings = get_settings()
-
-# Configure logger
+# Configure logger (console only; the file sink is attached lazily by
+# commands that do real work)
 logger.remove()  # Remove default handler
 logger.add(
     sys.stderr,
     format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>",
 )
-logger.add(
-    settings.log_file,
-    rotation=settings.log_rotation,
-    retention=settings.log_retention,
-    format="{time} | {level} | {message}",
-)
 
 app = typer.Typer(help="Common Core MCP CLI - Manage educational standards data")
 console = Console()
 
+_file_logging_configured = False
+
+def _scan_set_status(standard_sets_dir: Path) -> dict[str, tuple[bool, bool, bool]]:
+    """
+    Check data.json / processed.json / .pinecone_uploaded presence per set.
+
+    One scandir walk materializes every set's status, replacing a stat
+    syscall per file per table row; directory entries are compared by name
+    in memory.
+
+    Returns:
+        Mapping of set ID to (has_data, has_processed, has_uploaded)
+    """
+    status: dict[str, tuple[bool, bool, bool]] = {}
+    try:
+        with os.scandir(standard_sets_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                with os.scandir(entry.path) as children:
+                    names = {child.name for child in children}
+                status[entry.name] = (
+                    "data.json" in names,
+                    "processed.json" in names,
+                    ".pinecone_uploaded" in names,
+                )
+    except FileNotFoundError:
+        pass
+    return status
+
+
+# Markup for these cells is parsed once here; passing the shared Text
+# objects to add_row skips a per-row Text.from_markup during render
+_CHECK = Text.from_markup("[green]✓[/green]")
+_CROSS = Text.from_markup("[yellow]✗[/yellow]")
+
+
+def _trunc(s: str, n: int) -> str:
+    """Truncate to n characters with an ellipsis, untouched when short."""
+    return s if len(s) <= n else f"{s[:n]}..."
+
+
+# Row count above which table output falls back to plain text; rich table
+# rendering has a large per-row constant that dominates big catalogs
+_TABLE_FAST_THRESHOLD = 200
+
+_MARKUP_RE = re.compile(r"\[/?[a-z][^\]]*\]")
+
+
+def _print_table_fast(
+    headers: tuple[str, ...],
+    rows: list[tuple[str | Text, ...]],
+    title: str | None = None,
+    threshold: int = _TABLE_FAST_THRESHOLD,
+) -> None:
+    """
+    Print tabular data, bypassing rich rendering for large row counts.
+
+    Small tables keep the usual rich look; beyond the threshold the rows
+    are formatted in one width pass and written out in a single call,
+    with rich markup stripped. Cells may be pre-parsed Text objects.
+    """
+    if len(rows) <= threshold:
+        table = Table(*headers, title=title)
+        for row in rows:
+            table.add_row(*row)
+        console.print(table)
+        return
+
+    plain_rows = [
+        tuple(
+            cell.plain if isinstance(cell, Text) else _MARKUP_RE.sub("", cell)
+            for cell in row
+        )
+        for row in rows
+    ]
+    widths = [len(h) for h in headers]
+    for row in plain_rows:
+        for i, cell in enumerate(row):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+
+    fmt = "  ".join(f"{{:<{w}}}" for w in widths)
+    lines = []
+    if title:
+        lines.append(title)
+    lines.append(fmt.format(*headers))
+    lines.append("  ".join("-" * w for w in widths))
+    lines.extend(fmt.format(*row) for row in plain_rows)
+    console.file.write("\n".join(lines) + "\n")
+
+
+def _handle_error(user_msg: str, log_msg: str | None = None) -> None:
+    """
+    Print a red user-facing error, logging the traceback only when asked.
+
+    Input-validation failures surface through typer.BadParameter and never
+    reach this helper; passing log_msg=None keeps other expected failures
+    from paying traceback formatting and a synchronous log write.
+    """
+    console.print(f"[red]{user_msg}[/red]")
+    if log_msg is not None:
+        logger.exception(log_msg)
+
+
+def _batch_progress():
+    """
+    Progress display for multi-item loops: one Live renderer for the whole
+    batch instead of a spinner thread spawned and torn down per item.
+    """
+    from rich.progress import (
+        BarColumn,
+        MofNCompleteColumn,
+        Progress,
+        TextColumn,
+        TimeElapsedColumn,
+    )
+
+    return Progress(
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TimeElapsedColumn(),
+        console=console,
+        transient=True,
+    )
+
+
+def _prune_old_logs(log_file: Path, keep: int) -> None:
+    """
+    Delete rotated log files beyond the newest `keep`.
+
+    One directory scan at startup replaces loguru's retention policy,
+    which re-walks the log directory on every rotation check. Rotated
+    names embed a timestamp, so a lexicographic sort is chronological.
+    """
+    rotated = sorted(
+        path
+        for path in log_file.parent.glob(f"{log_file.stem}.*{log_file.suffix}")
+        if path != log_file
+    )
+    for stale in rotated[:-keep] if keep > 0 else rotated:
+        try:
+            stale.unlink()
+        except OSError:
+            pass
+
+
+def _configure_file_logging() -> None:
+    """
+    Attach the rotating file sink on first use by a mutating command.
+
+    Disabled by default for foreground CLI runs; when enabled, writes go
+    through loguru's background queue so log I/O stays off the command's
+    critical path.
+    """
+    global _file_logging_configured
+    if _file_logging_configured:
+        return
+    from tools.config import get_settings
+
+    settings = get_settings()
+    _file_logging_configured = True
+    if not settings.log_file_enabled:
+        return
+    _prune_old_logs(Path(settings.log_file), keep=settings.log_retention_files)
+    logger.add(
+        settings.log_file,
+        rotation=settings.log_rotation,
+        format="{time} | {level} | {message}",
+        enqueue=True,
+    )
+
 
 @app.command()
 def jurisdictions(
@@ -66,6 +235,8 @@ def jurisdictions(
     Filters can be combined: use --search to filter by name and --type to filter by type.
     """
     try:
+        from tools import api_client
+
         if force:
             console.print("[yellow]Forcing refresh from API...[/yellow]")
 
@@ -73,10 +244,10 @@ def jurisdictions(
         if type:
             valid_types = {"school", "organization", "state", "nation"}
             if type.lower() not in valid_types:
-                console.print(
-                    f"[red]Error: Invalid type '{type}'. Must be one of: {', '.join(sorted(valid_types))}[/red]"
+                raise typer.BadParameter(
+                    f"Invalid type '{type}'. Must be one of: {', '.join(sorted(valid_types))}",
+                    param_hint="--type",
                 )
-                raise typer.Exit(code=1)
 
         results = api_client.get_jurisdictions(
             search_term=search, type_filter=type, force_refresh=force
@@ -92,9 +263,10 @@ def jurisdictions(
         if not force:
             console.print("[dim]Tip: Use --force to refresh from API[/dim]")
 
+    except (typer.Exit, typer.BadParameter):
+        raise
     except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
-        logger.exception("Failed to fetch jurisdictions")
+        _handle_error(f"Error: {e}", "Failed to fetch jurisdictions")
         raise typer.Exit(code=1)
 
 
@@ -116,6 +288,8 @@ def jurisdiction_details(
     the full standard set content. Use the 'download' command to get full standard set data.
     """
     try:
+        from tools import api_client
+
         if force:
             console.print("[yellow]Forcing refresh from API...[/yellow]")
 
@@ -152,9 +326,10 @@ def jurisdiction_details(
         if not force:
             console.print("[dim]Tip: Use --force to refresh from API[/dim]")
 
+    except (typer.Exit, typer.BadParameter):
+        raise
     except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
-        logger.exception("Failed to fetch jurisdiction details")
+        _handle_error(f"Error: {e}", "Failed to fetch jurisdiction details")
         raise typer.Exit(code=1)
 
 
@@ -210,18 +385,20 @@ def download_sets(
     Use --dry-run to preview what would be downloaded without actually downloading anything.
     """
     try:
+        from tools import api_client
+        from tools.config import get_settings
+        from tools.pinecone_processor import process_and_save
+
+        settings = get_settings()
+
         # Validate arguments
         if not set_id and not jurisdiction:
-            console.print(
-                "[red]Error: Must provide either set_id or --jurisdiction[/red]"
-            )
-            raise typer.Exit(code=1)
+            raise typer.BadParameter("Must provide either set_id or --jurisdiction")
 
         if set_id and jurisdiction:
-            console.print(
-                "[red]Error: Cannot specify both set_id and --jurisdiction[/red]"
-            )
-            raise typer.Exit(code=1)
+            raise typer.BadParameter("Cannot specify both set_id and --jurisdiction")
+
+        _configure_file_logging()
 
         # Download by ID
         if set_id:
@@ -274,20 +451,16 @@ def download_sets(
             all_sets = jurisdiction_data.standardSets
 
             # Apply filters using the API client's filter function
-            from tools.api_client import _filter_standard_set
-
-            filtered_sets = [
-                s
-                for s in all_sets
-                if _filter_standard_set(
-                    s,
-                    education_levels=education_levels_list,
-                    publication_status=publication_status,
-                    valid_year=valid_year,
-                    title_search=title,
-                    subject_search=subject,
-                )
-            ]
+            from tools.api_client import _filter_standard_set, _FilterSpec
+
+            spec = _FilterSpec.build(
+                education_levels=education_levels_list,
+                publication_status=publication_status,
+                valid_year=valid_year,
+                title_search=title,
+                subject_search=subject,
+            )
+            filtered_sets = [s for s in all_sets if _filter_standard_set(s, spec)]
 
             if not filtered_sets:
                 console.print(
@@ -305,34 +478,35 @@ def download_sets(
                     f"\n[bold]Standard sets to download ({len(filtered_sets)}):[/bold]"
                 )
 
-            table = Table(
-                "Set ID",
-                "Subject",
-                "Title",
-                "Grade Levels",
-                "Status",
-                "Year",
-                "Downloaded",
-                title="Standard Sets",
-            )
-            for s in filtered_sets:
-                display_id = s.id[:20] + "..." if len(s.id) > 20 else s.id
-                # Check if already downloaded
-                set_data_path = settings.standard_sets_dir / s.id / "data.json"
-                is_downloaded = set_data_path.exists()
-                downloaded_status = (
-                    "[green]✓[/green]" if is_downloaded else "[yellow]✗[/yellow]"
-                )
-                table.add_row(
-                    display_id,
+            # One pass builds each display row; every per-row string is
+            # computed exactly once
+            set_status = _scan_set_status(settings.standard_sets_dir)
+            no_status = (False, False, False)
+            rows = [
+                (
+                    _trunc(s.id, 20),
                     s.subject,
                     s.title[:40],
                     ", ".join(s.educationLevels),
                     s.document.publicationStatus or "N/A",
-                    s.document.valid,
-                    downloaded_status,
+                    s.document.valid or "N/A",
+                    _CHECK if set_status.get(s.id, no_status)[0] else _CROSS,
                 )
-            console.print(table)
+                for s in filtered_sets
+            ]
+            _print_table_fast(
+                (
+                    "Set ID",
+                    "Subject",
+                    "Title",
+                    "Grade Levels",
+                    "Status",
+                    "Year",
+                    "Downloaded",
+                ),
+                rows,
+                title="Standard Sets",
+            )
 
             # If dry run, show summary and exit
             if dry_run:
@@ -359,35 +533,50 @@ def download_sets(
             downloaded = 0
             failed = 0
 
-            for i, standard_set in enumerate(filtered_sets, 1):
-                set_id = standard_set.id
-                try:
-                    with console.status(
-                        f"[bold blue][{i}/{len(filtered_sets)}] Downloading {set_id[:20]}..."
-                    ):
-                        api_client.download_standard_set(set_id, force_refresh=force)
-                    downloaded += 1
-
-                    # Process the downloaded set
-                    try:
-                        with console.status(
-                            f"[bold blue][{i}/{len(filtered_sets)}] Processing {set_id[:20]}..."
-                        ):
-                            process_and_save(set_id)
-                    except FileNotFoundError:
-                        console.print(
-                            f"[yellow]Warning: Skipping processing for {set_id[:20]}... (data.json not found)[/yellow]"
-                        )
-                    except Exception as e:
-                        console.print(
-                            f"[yellow]Warning: Failed to process {set_id[:20]}...: {e}[/yellow]"
-                        )
-                        logger.exception(f"Failed to process standard set {set_id}")
+            from concurrent.futures import ThreadPoolExecutor, as_completed
 
+            def fetch_and_process(sid: str) -> None:
+                api_client.download_standard_set(sid, force_refresh=force)
+                # Process the downloaded set; processing of finished sets
+                # overlaps the remaining downloads inside the pool
+                try:
+                    process_and_save(sid)
+                except FileNotFoundError:
+                    console.print(
+                        f"[yellow]Warning: Skipping processing for {sid[:20]}... (data.json not found)[/yellow]"
+                    )
                 except Exception as e:
-                    console.print(f"[red]✗ Failed to download {set_id}: {e}[/red]")
-                    logger.exception(f"Failed to download standard set {set_id}")
-                    failed += 1
+                    console.print(
+                        f"[yellow]Warning: Failed to process {sid[:20]}...: {e}[/yellow]"
+                    )
+                    logger.exception(f"Failed to process standard set {sid}")
+
+            # Downloads are I/O-bound; the api_client token bucket keeps the
+            # concurrent workers inside the server rate limit
+            max_workers = min(8, max(1, settings.max_requests_per_minute // 10))
+            with _batch_progress() as progress:
+                task = progress.add_task(
+                    "[bold blue]Downloading...", total=len(filtered_sets)
+                )
+                with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                    futures = {
+                        executor.submit(fetch_and_process, s.id): s.id
+                        for s in filtered_sets
+                    }
+                    for future in as_completed(futures):
+                        sid = futures[future]
+                        try:
+                            future.result()
+                            downloaded += 1
+                        except Exception as e:
+                            console.print(
+                                f"[red]✗ Failed to download {sid}: {e}[/red]"
+                            )
+                            logger.exception(
+                                f"Failed to download standard set {sid}"
+                            )
+                            failed += 1
+                        progress.advance(task)
 
             # Summary
             console.print(
@@ -398,9 +587,10 @@ def download_sets(
                     f"[red]✗ Failed to download {failed} standard set(s)[/red]"
                 )
 
+    except (typer.Exit, typer.BadParameter):
+        raise
     except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
-        logger.exception("Failed to download standard sets")
+        _handle_error(f"Error: {e}", "Failed to download standard sets")
         raise typer.Exit(code=1)
 
 
@@ -408,6 +598,10 @@ def download_sets(
 def list_datasets():
     """List all downloaded standard sets and their processing status."""
     try:
+        from tools import data_manager
+        from tools.config import get_settings
+
+        settings = get_settings()
         datasets = data_manager.list_downloaded_standard_sets()
 
         if not datasets:
@@ -415,49 +609,51 @@ def list_datasets():
             console.print("[dim]Use 'download-sets' to download standard sets.[/dim]")
             return
 
-        # Check for processed.json files
+        # Check for processed.json files with one directory walk
+        set_status = _scan_set_status(settings.standard_sets_dir)
         for d in datasets:
-            set_dir = settings.standard_sets_dir / d.set_id
-            processed_file = set_dir / "processed.json"
-            d.processed = processed_file.exists()
+            d.processed = set_status.get(d.set_id, (False, False, False))[1]
 
         # Count processed vs unprocessed
         processed_count = sum(1 for d in datasets if d.processed)
         unprocessed_count = len(datasets) - processed_count
 
-        table = Table(
-            "Set ID",
-            "Jurisdiction",
-            "Subject",
-            "Title",
-            "Grades",
-            "Status",
-            "Processed",
-            title="Downloaded Standard Sets",
-        )
-        for d in datasets:
-            # Truncate long set IDs
-            display_id = d.set_id[:25] + "..." if len(d.set_id) > 25 else d.set_id
-
-            table.add_row(
-                display_id,
+        # One pass builds each display row, truncating long fields once
+        rows = [
+            (
+                _trunc(d.set_id, 25),
                 d.jurisdiction,
                 d.subject[:30],
                 d.title[:30],
                 ", ".join(d.education_levels),
                 d.publication_status,
-                "[green]✓[/green]" if d.processed else "[yellow]✗[/yellow]",
+                _CHECK if d.processed else _CROSS,
             )
+            for d in datasets
+        ]
 
-        console.print(table)
+        _print_table_fast(
+            (
+                "Set ID",
+                "Jurisdiction",
+                "Subject",
+                "Title",
+                "Grades",
+                "Status",
+                "Processed",
+            ),
+            rows,
+            title="Downloaded Standard Sets",
+        )
         console.print("\n[bold]Summary:[/bold]")
         console.print(f"  Total: {len(datasets)} standard sets")
         console.print(f"  Processed: [green]{processed_count}[/green]")
         console.print(f"  Unprocessed: [yellow]{unprocessed_count}[/yellow]")
 
+    except (typer.Exit, typer.BadParameter):
+        raise
     except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
-        logger.exception("Failed to list datasets")
+        _handle_error(f"Error: {e}", "Failed to list datasets")
         raise typer.Exit(code=1)
 
 
@@ -472,6 +668,7 @@ def pinecone_init():
     try:
         from src.pinecone_client import PineconeClient
 
+        _configure_file_logging()
         console.print("[bold]Initializing Pinecone...[/bold]")
 
         # Initialize Pinecone client (validates API key)
@@ -520,9 +717,10 @@ def pinecone_init():
             else:
                 console.print("  Namespaces: [yellow]None (empty index)[/yellow]")
 
+    except (typer.Exit, typer.BadParameter):
+        raise
     except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
-        logger.exception("Failed to initialize Pinecone")
+        _handle_error(f"Error: {e}", "Failed to initialize Pinecone")
         raise typer.Exit(code=1)
 
 
@@ -555,23 +753,22 @@ def pinecone_upload(
     If neither is provided, you'll be prompted to confirm uploading all sets.
     """
     try:
-        from src.pinecone_client import PineconeClient
-        from tools.pinecone_models import ProcessedStandardSet
-        import json
+        import queue
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
 
-        # Initialize Pinecone client
-        try:
-            client = PineconeClient()
-        except ValueError as e:
-            console.print(f"[red]Error: {e}[/red]")
-            raise typer.Exit(code=1)
+        import orjson
 
-        # Validate index exists
-        try:
-            client.validate_index()
-        except ValueError as e:
-            console.print(f"[red]Error: {e}[/red]")
-            raise typer.Exit(code=1)
+        from src.pinecone_client import (
+            PineconeClient,
+            RecordBatcher,
+            get_pinecone_client,
+        )
+        from tools.config import get_settings
+        from tools.pinecone_models import ProcessedStandardSet
+
+        settings = get_settings()
+        _configure_file_logging()
 
         # Discover standard sets with processed.json
         standard_sets_dir = settings.standard_sets_dir
@@ -582,64 +779,62 @@ def pinecone_upload(
             )
             return
 
-        # Find all sets with processed.json
-        sets_to_upload = []
-        for set_dir in standard_sets_dir.iterdir():
-            if not set_dir.is_dir():
+        # Find all sets with processed.json. The single scandir walk covers
+        # the processed.json and upload-marker checks at once, so discovery
+        # does no per-directory stat calls. Already-uploaded sets are only
+        # counted, never carried through the preview and upload passes.
+        set_status = _scan_set_status(standard_sets_dir)
+        sets_to_upload: list[tuple[str, Path]] = []
+        skipped_count = 0
+        for sid, (_, processed, uploaded) in set_status.items():
+            if not processed:
                 continue
-
-            processed_file = set_dir / "processed.json"
-            if not processed_file.exists():
+            if uploaded and not force:
+                if not set_id or sid == set_id:
+                    skipped_count += 1
                 continue
-
-            set_id_from_dir = set_dir.name
-
-            # Check if already uploaded (unless --force)
-            # Mark all sets during discovery; filtering by --set-id happens later
-            if not force and PineconeClient.is_uploaded(set_dir):
-                sets_to_upload.append(
-                    (set_id_from_dir, set_dir, True)
-                )  # True = already uploaded
-            else:
-                sets_to_upload.append(
-                    (set_id_from_dir, set_dir, False)
-                )  # False = needs upload
-
-        if not sets_to_upload:
-            console.print(
-                "[yellow]No standard sets with processed.json found.[/yellow]"
-            )
-            console.print(
-                "[dim]Use 'download-sets' to download and process standard sets first.[/dim]"
-            )
-            return
+            sets_to_upload.append((sid, standard_sets_dir / sid))
 
         # Filter by --set-id if provided
         if set_id:
             sets_to_upload = [
-                (sid, sdir, skipped)
-                for sid, sdir, skipped in sets_to_upload
-                if sid == set_id
+                (sid, sdir) for sid, sdir in sets_to_upload if sid == set_id
             ]
             if not sets_to_upload:
+                if skipped_count:
+                    console.print(
+                        f"[yellow]Standard set '{set_id}' is already uploaded. Use --force to re-upload.[/yellow]"
+                    )
+                else:
+                    console.print(
+                        f"[yellow]Standard set '{set_id}' not found or has no processed.json.[/yellow]"
+                    )
+                return
+
+        if not sets_to_upload:
+            if skipped_count:
                 console.print(
-                    f"[yellow]Standard set '{set_id}' not found or has no processed.json.[/yellow]"
+                    f"[yellow]All {skipped_count} standard set(s) already uploaded. Use --force to re-upload.[/yellow]"
                 )
-                return
+            else:
+                console.print(
+                    "[yellow]No standard sets with processed.json found.[/yellow]"
+                )
+                console.print(
+                    "[dim]Use 'download-sets' to download and process standard sets first.[/dim]"
+                )
+            return
 
         # If neither --set-id nor --all provided, prompt for confirmation
         if not set_id and not all:
             console.print(
-                f"\n[bold]Found {len(sets_to_upload)} standard set(s) with processed.json:[/bold]"
+                f"\n[bold]Found {len(sets_to_upload)} standard set(s) ready to upload"
+                + (f" ({skipped_count} already uploaded)" if skipped_count else "")
+                + ":[/bold]"
             )
             table = Table("Set ID", "Status", title="Standard Sets")
-            for sid, sdir, skipped in sets_to_upload:
-                status = (
-                    "[yellow]Already uploaded[/yellow]"
-                    if skipped
-                    else "[green]Ready[/green]"
-                )
-                table.add_row(sid, status)
+            for sid, sdir in sets_to_upload:
+                table.add_row(sid, "[green]Ready[/green]")
             console.print(table)
 
             if not typer.confirm(
@@ -648,24 +843,27 @@ def pinecone_upload(
                 console.print("[yellow]Upload cancelled.[/yellow]")
                 return
 
+        # Decode each processed.json at most once; the preview loop and the
+        # upload loop below share the cache instead of double-decoding
+        processed_cache: dict[Path, dict] = {}
+
+        def load_processed(sdir: Path) -> dict:
+            data = processed_cache.get(sdir)
+            if data is None:
+                data = orjson.loads((sdir / "processed.json").read_bytes())
+                processed_cache[sdir] = data
+            return data
+
         # Show what would be uploaded (dry-run or preview)
         if dry_run or not all:
             console.print(
                 f"\n[bold]Standard sets to upload ({len(sets_to_upload)}):[/bold]"
             )
             table = Table("Set ID", "Records", "Status", title="Upload Preview")
-            for sid, sdir, skipped in sets_to_upload:
-                if skipped and not force:
-                    table.add_row(
-                        sid, "N/A", "[yellow]Skipped (already uploaded)[/yellow]"
-                    )
-                    continue
-
+            for sid, sdir in sets_to_upload:
                 # Load processed.json to count records
                 try:
-                    with open(sdir / "processed.json", encoding="utf-8") as f:
-                        processed_data = json.load(f)
-                    record_count = len(processed_data.get("records", []))
+                    record_count = len(load_processed(sdir).get("records", []))
                     status = (
                         "[green]Ready[/green]"
                         if not dry_run
@@ -678,60 +876,145 @@ def pinecone_upload(
 
         if dry_run:
             console.print(
-                f"\n[yellow][DRY RUN] Would upload {len([s for s in sets_to_upload if not s[2] or force])} standard set(s)[/yellow]"
+                f"\n[yellow][DRY RUN] Would upload {len(sets_to_upload)} standard set(s)[/yellow]"
             )
             console.print("[dim]Run without --dry-run to actually upload.[/dim]")
             return
 
-        # Perform uploads
+        # Only a real upload needs the SDK client and the describe-index
+        # round-trip; dry runs above stay purely filesystem-based. The
+        # process-wide singleton is reused across calls.
+        try:
+            client = get_pinecone_client()
+            client.validate_index()
+        except ValueError as e:
+            console.print(f"[red]Error: {e}[/red]")
+            raise typer.Exit(code=1)
+
+        # Perform uploads. Records from all sets feed one shared batcher so
+        # many small sets amortize into near-full upsert requests instead of
+        # paying a round-trip each; a set is only marked uploaded once its
+        # last record has been flushed.
         uploaded_count = 0
         failed_count = 0
-        skipped_count = 0
 
-        for i, (sid, sdir, already_uploaded) in enumerate(sets_to_upload, 1):
-            if already_uploaded and not force:
-                skipped_count += 1
-                continue
+        batcher = RecordBatcher(client, batch_size=batch_size)
 
-            try:
-                # Load processed.json
-                with open(sdir / "processed.json", encoding="utf-8") as f:
-                    processed_data = json.load(f)
-
-                processed_set = ProcessedStandardSet(**processed_data)
-                records = processed_set.records
+        with _batch_progress() as progress:
+            task = progress.add_task(
+                "[bold blue]Uploading...", total=len(sets_to_upload)
+            )
 
-                if not records:
+            def make_on_complete(sid: str, sdir: Path, record_count: int):
+                def on_complete() -> None:
+                    nonlocal uploaded_count
+                    PineconeClient.mark_uploaded(sdir)
+                    uploaded_count += 1
                     console.print(
-                        f"[yellow]Skipping {sid} (no records)[/yellow]"
+                        f"[green]✓ Uploaded {sid} ({record_count} records)[/green]"
+                    )
+                    progress.update(
+                        task, advance=1, description=f"Uploaded {sid[:20]}"
                     )
-                    skipped_count += 1
-                    continue
 
-                # Upload records
-                with console.status(
-                    f"[bold blue][{i}/{len(sets_to_upload)}] Uploading {sid} ({len(records)} records)"
-                ):
-                    client.batch_upsert(records, batch_size=batch_size)
+                return on_complete
+
+            # Loader thread decodes and validates the next set while the
+            # main thread feeds the batcher's network flushes, so JSON
+            # parse + pydantic validation overlap the HTTP round-trips.
+            # The bounded queue keeps at most two validated sets in memory.
+            # stop_loading lets the consumer abandon the pipeline (Ctrl-C,
+            # an escaping error) without stranding the loader blocked on a
+            # full queue, which would hang the executor's shutdown join.
+            load_queue: queue.Queue = queue.Queue(maxsize=2)
+            stop_loading = threading.Event()
+
+            def queue_item(item) -> bool:
+                """Put onto the bounded queue, bailing out if consumption stopped."""
+                while not stop_loading.is_set():
+                    try:
+                        load_queue.put(item, timeout=0.2)
+                        return True
+                    except queue.Full:
+                        continue
+                return False
+
+            def load_sets() -> None:
+                for sid, sdir in sets_to_upload:
+                    if stop_loading.is_set():
+                        return
+                    try:
+                        # Reuses the preview decode when the set was listed
+                        processed_data = load_processed(sdir)
+                        processed_set = ProcessedStandardSet.model_validate(
+                            processed_data
+                        )
+                        item = (sid, sdir, processed_set.records, None)
+                    except Exception as e:
+                        item = (sid, sdir, None, e)
+                    if not queue_item(item):
+                        return
+                queue_item(None)
 
-                # Mark as uploaded
-                PineconeClient.mark_uploaded(sdir)
-                uploaded_count += 1
-                console.print(
-                    f"[green]✓ [{i}/{len(sets_to_upload)}] Uploaded {sid} ({len(records)} records)[/green]"
-                )
+            with ThreadPoolExecutor(max_workers=1) as loader:
+                loader_future = loader.submit(load_sets)
+                try:
+                    while True:
+                        item = load_queue.get()
+                        if item is None:
+                            break
+                        sid, sdir, records, load_error = item
+
+                        if load_error is not None:
+                            if isinstance(load_error, FileNotFoundError):
+                                console.print(
+                                    f"[red]✗ Failed: {sid} (processed.json not found)[/red]"
+                                )
+                            else:
+                                console.print(
+                                    f"[red]✗ Failed: {sid} ({load_error})[/red]"
+                                )
+                            logger.error(
+                                f"Failed to upload standard set {sid}: {load_error}"
+                            )
+                            failed_count += 1
+                            progress.advance(task)
+                            continue
+
+                        if not records:
+                            console.print(
+                                f"[yellow]Skipping {sid} (no records)[/yellow]"
+                            )
+                            skipped_count += 1
+                            progress.advance(task)
+                            continue
+
+                        try:
+                            batcher.add_set(
+                                sid,
+                                records,
+                                set_dir=sdir,
+                                force=force,
+                                on_complete=make_on_complete(sid, sdir, len(records)),
+                            )
+                        except Exception as e:
+                            console.print(f"[red]✗ Failed: {sid} ({e})[/red]")
+                            logger.exception(f"Failed to upload standard set {sid}")
+                            failed_count += 1
+                            progress.advance(task)
+
+                    loader_future.result()
+                finally:
+                    # Covers early exits from the loop above: wake the
+                    # loader out of any blocked put so the executor join
+                    # in __exit__ can complete
+                    stop_loading.set()
 
-            except FileNotFoundError:
-                console.print(
-                    f"[red]✗ [{i}/{len(sets_to_upload)}] Failed: {sid} (processed.json not found)[/red]"
-                )
-                logger.exception(f"Failed to upload standard set {sid}")
-                failed_count += 1
+            try:
+                batcher.flush()
             except Exception as e:
-                console.print(
-                    f"[red]✗ [{i}/{len(sets_to_upload)}] Failed: {sid} ({e})[/red]"
-                )
-                logger.exception(f"Failed to upload standard set {sid}")
+                console.print(f"[red]✗ Failed to flush final batch: {e}[/red]")
+                logger.exception("Failed to flush final upsert batch")
                 failed_count += 1
 
         # Summary
@@ -742,9 +1025,10 @@ def pinecone_upload(
         if failed_count > 0:
             console.print(f"  Failed: [red]{failed_count}[/red]")
 
+    except (typer.Exit, typer.BadParameter):
+        raise
     except Exception as e:
-        console.print(f"[red]Error: {e}[/red]")
-        logger.exception("Failed to upload to Pinecone")
+        _handle_error(f"Error: {e}", "Failed to upload to Pinecone")
         raise typer.Exit(code=1)
 
 
@@ -2,18 +2,30 @@
 
 from __future__ import annotations
 
+import os
+from functools import cached_property
 from pathlib import Path
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Computed once at import; every derived path hangs off this constant
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+# Checked once so instantiation skips the dotenv scan when no file exists
+_ENV_FILE = ".env" if os.path.exists(".env") else None
+
 
 class ToolsSettings(BaseSettings):
     """Configuration settings for the tools module."""
 
+    # frozen keeps the shared singleton immutable (and hashable); the
+    # cached path properties below still work because cached_property
+    # writes to the instance __dict__ directly
     model_config = SettingsConfigDict(
-        env_file=".env",
+        env_file=_ENV_FILE,
         env_file_encoding="utf-8",
         case_sensitive=False,
+        frozen=True,
     )
 
     # API Configuration
@@ -22,31 +34,32 @@ class ToolsSettings(BaseSettings):
     max_requests_per_minute: int = 60
 
     # Path Configuration
-    # These are computed properties based on project root
-    @property
+    # Cached per instance so hot loops don't redo Path arithmetic per access
+    @cached_property
     def project_root(self) -> Path:
         """Get the project root directory."""
-        return Path(__file__).parent.parent
+        return _PROJECT_ROOT
 
-    @property
+    @cached_property
     def raw_data_dir(self) -> Path:
         """Get the raw data directory."""
         return self.project_root / "data" / "raw"
 
-    @property
+    @cached_property
     def standard_sets_dir(self) -> Path:
         """Get the standard sets directory."""
         return self.raw_data_dir / "standardSets"
 
-    @property
+    @cached_property
     def processed_data_dir(self) -> Path:
         """Get the processed data directory."""
         return self.project_root / "data" / "processed"
 
     # Logging Configuration
+    log_file_enabled: bool = False
     log_file: str = "data/cli.log"
     log_rotation: str = "10 MB"
-    log_retention: str = "7 days"
+    log_retention_files: int = 7
 
     # Pinecone Configuration
     pinecone_api_key: str = ""
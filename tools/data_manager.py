@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from typing import Any
 
+import orjson
 from loguru import logger
 
 from tools.config import get_settings
-from tools.models import StandardSetResponse
 
 settings = get_settings()
 
@@ -17,10 +19,28 @@ RAW_DATA_DIR = settings.raw_data_dir
 STANDARD_SETS_DIR = settings.standard_sets_dir
 PROCESSED_DATA_DIR = settings.processed_data_dir
 
+# Listing index: per-set display metadata keyed by a data.json
+# (mtime_ns, size) token, so warm `list` runs skip decoding and validating
+# every data.json
+_INDEX_FILE = RAW_DATA_DIR / ".sets_index.json"
+_INDEX_VERSION = 2
 
-@dataclass
+# In-process memo on top of the on-disk index: repeat calls in the same
+# process reuse the StandardSetInfo when the data.json token is unchanged,
+# skipping even the index rehydration. Safe because data.json is replaced
+# atomically, never mutated in place.
+_SET_INFO_CACHE: dict[str, tuple[int, int, "StandardSetInfo"]] = {}
+
+
+@dataclass(slots=True)
 class StandardSetInfo:
-    """Information about a downloaded standard set with processing status."""
+    """
+    Information about a downloaded standard set with processing status.
+
+    Slotted to drop the per-instance __dict__ — one of these exists per
+    set in every listing. Not frozen: callers fill in `processed` after
+    the shared status scan.
+    """
 
     set_id: str
     title: str
@@ -32,50 +52,170 @@ class StandardSetInfo:
     processed: bool
 
 
+def _load_index() -> dict[str, dict[str, Any]]:
+    """Read the listing index, returning {} when missing, stale, or corrupt."""
+    try:
+        data = orjson.loads(_INDEX_FILE.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    if data.get("version") != _INDEX_VERSION:
+        return {}
+    return data.get("sets", {})
+
+
+def _write_index(entries: dict[str, dict[str, Any]]) -> None:
+    """Atomically replace the listing index; failures only cost a rescan."""
+    tmp_path = _INDEX_FILE.with_suffix(".tmp")
+    try:
+        RAW_DATA_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path.write_bytes(
+            orjson.dumps({"version": _INDEX_VERSION, "sets": entries})
+        )
+        os.replace(tmp_path, _INDEX_FILE)
+    except OSError as e:
+        logger.warning(f"Failed to write sets index: {e}")
+
+
+def _info_from_entry(set_id: str, entry: dict[str, Any]) -> StandardSetInfo:
+    """Rehydrate a StandardSetInfo from an index entry."""
+    return StandardSetInfo(
+        set_id=set_id,
+        title=entry["title"],
+        subject=entry["subject"],
+        education_levels=entry["education_levels"],
+        jurisdiction=entry["jurisdiction"],
+        publication_status=entry["publication_status"],
+        valid_year=entry["valid_year"],
+        processed=False,
+    )
+
+
+def _entry_from_info(info: StandardSetInfo, mtime_ns: int, size: int) -> dict[str, Any]:
+    """Build an index entry for a StandardSetInfo and its file token."""
+    return {
+        "mtime_ns": mtime_ns,
+        "size": size,
+        "title": info.title,
+        "subject": info.subject,
+        "education_levels": info.education_levels,
+        "jurisdiction": info.jurisdiction,
+        "publication_status": info.publication_status,
+        "valid_year": info.valid_year,
+    }
+
+
+def _parse_set_info(data_file: str) -> StandardSetInfo | None:
+    """
+    Decode one data.json into a summary StandardSetInfo.
+
+    The summary only needs a handful of scalar fields, so they are pulled
+    straight from the parsed dict instead of validating the whole response
+    (including the standards map) through StandardSetResponse. Returns
+    None and logs a warning on malformed payloads.
+    """
+    try:
+        with open(data_file, "rb") as f:
+            raw_data = orjson.loads(f.read())
+
+        data = raw_data["data"]
+        document = data["document"]
+
+        return StandardSetInfo(
+            set_id=data["id"],
+            title=data["title"],
+            subject=data["subject"],
+            education_levels=data["educationLevels"],
+            jurisdiction=data["jurisdiction"]["title"],
+            publication_status=document.get("publicationStatus") or "Unknown",
+            valid_year=document.get("valid"),
+            processed=False,  # TODO: Check against processed directory
+        )
+    except (orjson.JSONDecodeError, IOError, KeyError, TypeError) as e:
+        logger.warning(f"Failed to read {data_file}: {e}")
+        return None
+
+
 def list_downloaded_standard_sets() -> list[StandardSetInfo]:
     """
     List all downloaded standard sets from the standardSets directory.
 
+    Display metadata for each set is cached in a small index file keyed by
+    the data.json mtime, so repeat listings only stat each file and fall
+    back to the full decode-and-validate path for new or changed sets.
+
     Returns:
         List of StandardSetInfo with standard set info and processing status
     """
     if not STANDARD_SETS_DIR.exists():
         return []
 
+    index = _load_index()
+    entries: dict[str, dict[str, Any]] = {}
     datasets = []
-    for set_dir in STANDARD_SETS_DIR.iterdir():
-        if not set_dir.is_dir():
-            continue
-
-        data_file = set_dir / "data.json"
-        if not data_file.exists():
-            continue
-
-        try:
-            with open(data_file, encoding="utf-8") as f:
-                raw_data = json.load(f)
-
-            # Parse the API response wrapper
-            response = StandardSetResponse(**raw_data)
-            standard_set = response.data
-
-            # Build the dataset info
-            dataset_info = StandardSetInfo(
-                set_id=standard_set.id,
-                title=standard_set.title,
-                subject=standard_set.subject,
-                education_levels=standard_set.educationLevels,
-                jurisdiction=standard_set.jurisdiction.title,
-                publication_status=standard_set.document.publicationStatus or "Unknown",
-                valid_year=standard_set.document.valid,
-                processed=False,  # TODO: Check against processed directory
+    to_parse: list[tuple[str, int, int]] = []
+    rescanned = 0
+    with os.scandir(STANDARD_SETS_DIR) as it:
+        for dir_entry in it:
+            if not dir_entry.is_dir(follow_symlinks=False):
+                continue
+
+            data_file = os.path.join(dir_entry.path, "data.json")
+            try:
+                st = os.stat(data_file)
+            except OSError:
+                continue
+            mtime_ns, size = st.st_mtime_ns, st.st_size
+
+            set_id = dir_entry.name
+
+            # Steady state: one stat per set and the memoized info
+            memo = _SET_INFO_CACHE.get(set_id)
+            if memo is not None and memo[0] == mtime_ns and memo[1] == size:
+                info = memo[2]
+                entries[set_id] = index.get(set_id) or _entry_from_info(
+                    info, mtime_ns, size
+                )
+                datasets.append(info)
+                continue
+
+            cached = index.get(set_id)
+            if (
+                cached is not None
+                and cached.get("mtime_ns") == mtime_ns
+                and cached.get("size") == size
+            ):
+                info = _info_from_entry(set_id, cached)
+                _SET_INFO_CACHE[set_id] = (mtime_ns, size, info)
+                entries[set_id] = cached
+                datasets.append(info)
+                continue
+
+            to_parse.append((data_file, mtime_ns, size))
+
+    # Cache misses are independent file read + parse jobs, and both the
+    # read and the orjson decode release the GIL, so they fan out on a
+    # thread pool; results keep directory order
+    if to_parse:
+        with ThreadPoolExecutor(max_workers=min(16, len(to_parse))) as executor:
+            parsed = executor.map(
+                lambda args: _parse_set_info(args[0]), to_parse
             )
-
-            datasets.append(dataset_info)
-
-        except (json.JSONDecodeError, IOError, Exception) as e:
-            logger.warning(f"Failed to read {data_file}: {e}")
-            continue
+            for (data_file, mtime_ns, size), dataset_info in zip(to_parse, parsed):
+                if dataset_info is None:
+                    continue
+                entries[dataset_info.set_id] = _entry_from_info(
+                    dataset_info, mtime_ns, size
+                )
+                _SET_INFO_CACHE[dataset_info.set_id] = (
+                    mtime_ns,
+                    size,
+                    dataset_info,
+                )
+                rescanned += 1
+                datasets.append(dataset_info)
+
+    if rescanned or entries.keys() != index.keys():
+        _write_index(entries)
 
     logger.debug(f"Found {len(datasets)} downloaded standard sets")
     return datasets
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Any, Optional
 
 from pydantic import BaseModel, ConfigDict
@@ -57,6 +58,31 @@ class StandardSetReference(CSPBaseModel):
     educationLevels: list[str]
     document: Document
 
+    # Normalized views computed once per instance so hot filter loops don't
+    # re-allocate lowered/uppered strings on every predicate check. These
+    # are cached properties, not fields, so they stay out of serialization.
+
+    @cached_property
+    def title_lc(self) -> str:
+        """Lowercased title for case-insensitive matching."""
+        return self.title.lower()
+
+    @cached_property
+    def subject_lc(self) -> str:
+        """Lowercased subject for case-insensitive matching."""
+        return self.subject.lower()
+
+    @cached_property
+    def publication_status_lc(self) -> Optional[str]:
+        """Lowercased publication status, or None when the document has none."""
+        status = self.document.publicationStatus
+        return status.lower() if status else None
+
+    @cached_property
+    def education_levels_upper(self) -> frozenset[str]:
+        """Uppercased education levels as a set for intersection checks."""
+        return frozenset(level.upper() for level in self.educationLevels)
+
 
 class JurisdictionDetails(CSPBaseModel):
     """Full jurisdiction details including standard set references."""
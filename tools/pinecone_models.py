@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 
 
 class PineconeRecord(BaseModel):
@@ -17,6 +17,8 @@ class PineconeRecord(BaseModel):
         },
         # Use snake_case for field names (matches JSON schema)
         populate_by_name=True,
+        # Records are write-once: built by the processor, then only read
+        frozen=True,
     )
 
     # Core identifier - use alias to serialize as _id
@@ -70,26 +72,37 @@ class PineconeRecord(BaseModel):
         if not isinstance(v, list):
             return []
 
-        # Split comma-separated strings and flatten
-        flattened: list[str] = []
-        for item in v:
-            if isinstance(item, str):
-                # Split on commas and strip whitespace
-                split_items = [s.strip() for s in item.split(",") if s.strip()]
-                flattened.extend(split_items)
-
-        # Deduplicate while preserving order
-        seen: set[str] = set()
-        result: list[str] = []
-        for item in flattened:
-            if item not in seen:
-                seen.add(item)
-                result.append(item)
-
-        return result
-
+        # Join once and split once so the flattening runs in C-level str
+        # ops instead of a per-element Python loop; dict.fromkeys dedupes
+        # while preserving order
+        joined = ",".join(item for item in v if isinstance(item, str))
+        return list(
+            dict.fromkeys(
+                stripped for part in joined.split(",") if (stripped := part.strip())
+            )
+        )
 
 class ProcessedStandardSet(BaseModel):
     """Container for processed standard set records ready for Pinecone."""
 
+    model_config = ConfigDict(frozen=True)
+
     records: list[PineconeRecord]
+
+
+# Serializers resolved once at import; per-call model_dump_json re-resolves
+# them, which adds up when dumping many records
+_RECORD_TA = TypeAdapter(PineconeRecord)
+_SET_TA = TypeAdapter(ProcessedStandardSet)
+
+
+def dump_record_json(record: PineconeRecord, by_alias: bool = True) -> bytes:
+    """Serialize a record to JSON bytes via the cached adapter."""
+    return _RECORD_TA.dump_json(record, by_alias=by_alias)
+
+
+def dump_processed_set_json(
+    processed: ProcessedStandardSet, by_alias: bool = True
+) -> bytes:
+    """Serialize a processed set to JSON bytes via the cached adapter."""
+    return _SET_TA.dump_json(processed, by_alias=by_alias)